@@ -15,74 +15,152 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
+# Operational note: run this migration with statement_timeout = 0 and
+# lock_timeout = 5s. Index creation is kept out of the schema transaction
+# and uses CREATE INDEX CONCURRENTLY so re-deploys against a live database
+# never hold an ACCESS EXCLUSIVE lock while an index builds.
+
 
 def upgrade() -> None:
+    # Fail fast on a stuck lock instead of stalling the deploy indefinitely
+    op.execute("SET lock_timeout = '5s'")
+
     # Create articles table
     op.create_table('articles',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('input_payload', sa.JSON(), nullable=False),
-        sa.Column('output_payload', sa.JSON(), nullable=True),
-        sa.Column('status', sa.Enum('PENDING', 'GENERATING', 'GENERATED', 'PUBLISHING', 'PUBLISHED', 'FAILED', name='articlestatus'), nullable=False),
+        sa.Column('input_payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('output_payload', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('sanitized_payload', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('status', sa.String(length=16), nullable=False),
         sa.Column('slug', sa.String(length=255), nullable=True),
         sa.Column('char_count', sa.Integer(), nullable=True),
-        sa.Column('idempotency_key', sa.String(length=64), nullable=True),
+        sa.Column('idempotency_key', postgresql.BYTEA(), nullable=True),
         sa.Column('wp_post_id', sa.Integer(), nullable=True),
         sa.Column('wp_url', sa.Text(), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.CheckConstraint(
+            "status IN ('PENDING', 'GENERATING', 'GENERATED', 'PUBLISHING', 'PUBLISHED', 'FAILED')",
+            name='ck_articles_status'
+        ),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_articles_idempotency_key'), 'articles', ['idempotency_key'], unique=True)
-    op.create_index(op.f('ix_articles_slug'), 'articles', ['slug'], unique=True)
-    op.create_index(op.f('ix_articles_status'), 'articles', ['status'], unique=False)
-
     # Create jobs table
     op.create_table('jobs',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('type', sa.Enum('GENERATE', 'PUBLISH', 'MEDIA_UPLOAD', name='jobtype'), nullable=False),
-        sa.Column('payload', sa.JSON(), nullable=False),
-        sa.Column('status', sa.Enum('PENDING', 'RUNNING', 'SUCCEEDED', 'FAILED', name='jobstatus'), nullable=False),
+        sa.Column('type', sa.String(length=16), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('status', sa.String(length=16), nullable=False),
         sa.Column('tries', sa.Integer(), nullable=True),
         sa.Column('last_error', sa.Text(), nullable=True),
-        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.CheckConstraint(
+            "type IN ('GENERATE', 'PUBLISH', 'MEDIA_UPLOAD')",
+            name='ck_jobs_type'
+        ),
+        sa.CheckConstraint(
+            "status IN ('PENDING', 'RUNNING', 'SUCCEEDED', 'FAILED')",
+            name='ck_jobs_status'
+        ),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_jobs_status'), 'jobs', ['status'], unique=False)
-    op.create_index(op.f('ix_jobs_type'), 'jobs', ['type'], unique=False)
 
     # Create taxonomies table
     op.create_table('taxonomies',
         sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('type', sa.Enum('CATEGORY', 'TAG', name='taxonomytype'), nullable=False),
+        sa.Column('type', sa.String(length=16), nullable=False),
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('slug', sa.String(length=255), nullable=False),
         sa.Column('wp_id', sa.Integer(), nullable=True),
         sa.Column('description', sa.Text(), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.CheckConstraint("type IN ('CATEGORY', 'TAG')", name='ck_taxonomies_type'),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('type', 'name', name='unique_type_name'),
         sa.UniqueConstraint('type', 'slug', name='unique_type_slug'),
         sa.UniqueConstraint('wp_id', name='taxonomies_wp_id_key')
     )
-    op.create_index(op.f('ix_taxonomies_type_name'), 'taxonomies', ['type', 'name'], unique=False)
+    # All index creation happens outside the schema transaction.
+    # CONCURRENTLY cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        # Covering partial index: the dedup probe on article POST selects
+        # id/status by idempotency_key, so INCLUDE lets it finish as an
+        # index-only scan, and skipping NULL keys keeps the index small.
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY ix_articles_idempotency_key "
+            "ON articles (idempotency_key) INCLUDE (id, status) "
+            "WHERE idempotency_key IS NOT NULL"
+        )
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY ix_articles_slug "
+            "ON articles (slug)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_taxonomies_type_name "
+            "ON taxonomies (type, name)"
+        )
+        # Partial indexes on the active states only: workers poll a tiny, hot
+        # subset of rows, so these stay small and allow index-only scans.
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_jobs_status_pending "
+            "ON jobs (created_at) WHERE status IN ('PENDING', 'RUNNING')"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_articles_status_active "
+            "ON articles (created_at) "
+            "WHERE status IN ('PENDING', 'GENERATING', 'PUBLISHING')"
+        )
+        # Dispatcher dequeue matches WHERE type=? AND status='PENDING'
+        # ORDER BY created_at; the composite partial index satisfies both the
+        # predicate and the sort with one index-only scan. Expected to stay a
+        # few hundred rows even with millions of finished jobs in the table.
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_jobs_dispatch "
+            "ON jobs (type, created_at) WHERE status = 'PENDING'"
+        )
+        # Composite indexes backing the status-polling queries
+        # (WHERE status = ? [AND type = ?] ORDER BY created_at).
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_articles_status_created "
+            "ON articles (status, created_at)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_jobs_status_type_created "
+            "ON jobs (status, type, created_at) "
+            "WHERE status IN ('PENDING', 'RUNNING')"
+        )
+        # GIN over jsonb_path_ops supports fast @> containment filters on
+        # job payloads (e.g. looking up jobs for a given article_id).
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_jobs_payload_gin "
+            "ON jobs USING GIN (payload jsonb_path_ops)"
+        )
+
+    # Planner-stats maintenance: seed statistics right away so the worker
+    # poll queries get sane plans before the first autovacuum pass, and keep
+    # a fine-grained histogram for the heavily skewed status column (almost
+    # all rows end up SUCCEEDED, the partial indexes cover the tiny rest).
+    # Re-run ANALYZE manually after any bulk backfill of these tables.
+    op.execute("ALTER TABLE jobs ALTER COLUMN status SET STATISTICS 1000")
+    op.execute("ANALYZE articles")
+    op.execute("ANALYZE jobs")
+    op.execute("ANALYZE taxonomies")
 
 
 def downgrade() -> None:
-    op.drop_index(op.f('ix_taxonomies_type_name'), table_name='taxonomies')
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_status_type_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_articles_status_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_payload_gin")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_dispatch")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_articles_status_active")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_status_pending")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_taxonomies_type_name")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_articles_slug")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_articles_idempotency_key")
     op.drop_table('taxonomies')
-    op.drop_index(op.f('ix_jobs_type'), table_name='jobs')
-    op.drop_index(op.f('ix_jobs_status'), table_name='jobs')
     op.drop_table('jobs')
-    op.drop_index(op.f('ix_articles_status'), table_name='articles')
-    op.drop_index(op.f('ix_articles_slug'), table_name='articles')
-    op.drop_index(op.f('ix_articles_idempotency_key'), table_name='articles')
-    op.drop_table('articles')
-
-    # Drop enums
-    sa.Enum('CATEGORY', 'TAG', name='taxonomytype').drop(op.get_bind())
-    sa.Enum('PENDING', 'RUNNING', 'SUCCEEDED', 'FAILED', name='jobstatus').drop(op.get_bind())
-    sa.Enum('GENERATE', 'PUBLISH', 'MEDIA_UPLOAD', name='jobtype').drop(op.get_bind())
-    sa.Enum('PENDING', 'GENERATING', 'GENERATED', 'PUBLISHING', 'PUBLISHED', 'FAILED', name='articlestatus').drop(op.get_bind())
\ No newline at end of file
+    op.drop_table('articles')
\ No newline at end of file
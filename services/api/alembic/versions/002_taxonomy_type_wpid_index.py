@@ -0,0 +1,31 @@
+"""Composite index for taxonomy (type, wp_id) lookups
+
+Revision ID: 002_taxonomy_type_wpid_index
+Revises: 001_initial_tables
+Create Date: 2026-08-27 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '002_taxonomy_type_wpid_index'
+down_revision = '001_initial_tables'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # (type, name) is already covered by the unique_type_name
+        # constraint plus ix_taxonomies_type_name from 001; this adds the
+        # matching seek path for (type, wp_id) filters. Skipping NULL
+        # wp_ids keeps the index to rows that can actually resolve.
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_taxonomies_type_wp_id "
+            "ON taxonomies (type, wp_id) WHERE wp_id IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_taxonomies_type_wp_id")
@@ -1,16 +1,19 @@
 """
 Perplexity API client for article generation
 """
-import json
 import time
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import ClassVar, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
 import httpx
+import jinja2
+import msgspec
+import orjson
 from tenacity import (
-    retry, stop_after_attempt, wait_exponential,
+    retry, stop_after_attempt, wait_random_exponential,
     retry_if_exception_type, before_sleep_log
 )
 
@@ -30,6 +33,46 @@ class PerplexityResponse:
     finish_reason: str
 
 
+class OutlineSection(msgspec.Struct):
+    """Typed outline section as returned in JSON mode"""
+    h2: str
+    h3: List[str] = []
+
+
+class Outline(msgspec.Struct):
+    """Typed outline response shape
+
+    Metadata fields piggyback on the outline call so the separate
+    finalization round-trip can be skipped when they come back filled.
+    """
+    title: str = ""
+    sections: List[OutlineSection] = []
+    slug: str = ""
+    excerpt: str = ""
+    meta_description: str = ""
+    tags: List[str] = []
+    categories: List[str] = []
+
+
+class FinalizeResult(msgspec.Struct):
+    """Typed finalization response shape"""
+    title: str = ""
+    slug: str = ""
+    excerpt: str = ""
+    meta_description: str = ""
+    tags: List[str] = []
+    categories: List[str] = []
+    faq: List[Dict[str, str]] = []
+    cta_html: str = ""
+    schema_org: Dict[str, Any] = {}
+    hero_image_prompt: Optional[str] = None
+
+
+# Pre-built decoders validate the known shapes in a single C pass
+_outline_decoder = msgspec.json.Decoder(Outline)
+_finalize_decoder = msgspec.json.Decoder(FinalizeResult)
+
+
 class PerplexityAPIError(Exception):
     """Perplexity API error"""
     pass
@@ -37,33 +80,364 @@ class PerplexityAPIError(Exception):
 
 class PerplexityRateLimitError(PerplexityAPIError):
     """Rate limit exceeded"""
-    pass
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# Jittered backoff so concurrent workers don't retry in lockstep after a 429.
+# Sub-second floor with more attempts: LLM rate limits usually clear quickly,
+# so short jittered sleeps recover faster than a multi-second fixed floor.
+_jitter_wait = wait_random_exponential(multiplier=0.2, max=8)
+
+
+def _wait_with_retry_after(retry_state) -> float:
+    """Decorrelated-jitter wait, raised to the server's Retry-After hint if any"""
+    wait = _jitter_wait(retry_state)
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        wait = max(wait, retry_after)
+    return wait
+
+
+def _parse_retry_after(header_value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header value in seconds (date format is ignored)"""
+    if not header_value:
+        return None
+    try:
+        return float(header_value)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _build_context_fragments(
+    references: Tuple[str, ...],
+    must_topics: Tuple[str, ...],
+    bans: Tuple[str, ...]
+) -> Tuple[str, str, str]:
+    """
+    Build the per-article prompt context fragments once per input
+
+    The same references/must_topics/bans lists are re-joined for every
+    outline/section call of an article; memoizing on the tuple key avoids
+    redoing the string work 8-15 times per article.
+
+    Returns:
+        Tuple of (references_text, must_topics_text, bans_text)
+    """
+    references_text = f"\n参考URL: {', '.join(references)}" if references else ""
+    must_topics_text = f"\n必須トピック: {', '.join(must_topics)}" if must_topics else ""
+    bans_text = f"\n禁止事項: {', '.join(bans)}" if bans else ""
+    return references_text, must_topics_text, bans_text
+
+
+def _context_key(input_data: GenerateInput) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """Hashable cache key for _build_context_fragments"""
+    return (
+        tuple(str(url) for url in input_data.references),
+        tuple(input_data.must_topics),
+        tuple(input_data.bans),
+    )
+
+
+def _build_content_preview(sections: List[str], max_chars: int = 1000) -> str:
+    """Accumulate a bounded content preview without joining all sections"""
+    parts: List[str] = []
+    total = 0
+    for section in sections:
+        parts.append(section)
+        total += len(section) + 1
+        if total >= max_chars:
+            break
+    return "\n".join(parts)[:max_chars] + "..."
+
+
+# Prompt templates compiled once at import; rendering fills in only the
+# per-call values instead of rebuilding ~2 KB literals on every request.
+_OUTLINE_TPL = jinja2.Template("""以下の情報に基づいて記事の見出し構成を作成してください。
+
+### 記事情報:
+要約: {{ input_data.summary }}
+目的: {{ input_data.goal }}
+想定読者: {{ input_data.audience }}
+トーン: {{ input_data.tone.value }}
+目標文字数: {{ input_data.target_chars }}字{{ references_text }}{{ must_topics_text }}{{ bans_text }}
+
+### 要求事項:
+- H2見出しを6-9個作成
+- 各H2に対してH3見出しを2-3個作成
+- 見出しは論理的な順序で配置
+- SEOを意識したキーワード含有
+- 読者の関心を引く魅力的な見出し
+- SEOに最適化されたタイトルとメタ情報も同時に作成
+- slugはURLフレンドリー（英数字とハイフンのみ）
+
+### 出力形式:
+以下のJSON形式で出力してください:
+
+```json
+{
+  "title": "記事タイトル",
+  "sections": [
+    {
+      "h2": "H2見出し1",
+      "h3": ["H3見出し1-1", "H3見出し1-2"]
+    },
+    {
+      "h2": "H2見出し2",
+      "h3": ["H3見出し2-1", "H3見出し2-2", "H3見出し2-3"]
+    }
+  ],
+  "slug": "article-slug",
+  "excerpt": "記事の抜粋",
+  "meta_description": "メタディスクリプション（150文字以内）",
+  "tags": ["タグ1", "タグ2"],
+  "categories": ["カテゴリ1"]
+}
+```
+
+JSONのみを出力してください。""")
+
+_SECTION_TPL = jinja2.Template("""以下の見出し構成に基づいて、詳細なコンテンツを作成してください。
+
+### セクション情報:
+H2見出し: {{ h2_title }}
+H3見出し: {{ h3_text }}
+
+### 記事コンテキスト:
+要約: {{ input_data.summary }}
+目的: {{ input_data.goal }}
+想定読者: {{ input_data.audience }}
+トーン: {{ input_data.tone.value }}{{ must_topics_text }}
+
+### 要求事項:
+- 目標文字数: 約{{ target_chars }}文字
+- H2, H3見出しを適切に使用
+- 各H3セクションに具体的な内容を記述
+- 論理的で読みやすい構成
+- 専門性と信頼性を重視
+- 具体例や根拠を含める
+
+### 使用可能HTMLタグ:
+h2, h3, p, ul, ol, li, strong, em, a（hrefは信頼できるURLのみ）
+
+### 出力:
+HTMLコンテンツのみを出力してください。説明文は不要です。""")
+
+_FINALIZE_TPL = jinja2.Template("""以下の記事コンテンツに基づいて、完全な記事データを作成してください。
+
+### 元の要求:
+要約: {{ input_data.summary }}
+目的: {{ input_data.goal }}
+想定読者: {{ input_data.audience }}
+
+### 記事コンテンツ概要:
+{{ content_preview }}
+
+### 要求事項:
+- SEOに最適化されたタイトル
+- URLフレンドリーなslug（英数字とハイフンのみ）
+- 魅力的な抜粋文
+- メタディスクリプション（150文字以内）
+- 関連するタグ（最大10個）
+- 適切なカテゴリ（最大5個）
+- FAQ（質問と回答のペア、最大5個）
+- CTA（行動喚起）HTML
+
+### 出力形式:
+以下のJSON形式で出力してください:
+
+```json
+{
+  "title": "記事タイトル",
+  "slug": "article-slug",
+  "excerpt": "記事の抜粋",
+  "meta_description": "メタディスクリプション",
+  "tags": ["タグ1", "タグ2"],
+  "categories": ["カテゴリ1"],
+  "faq": [
+    {
+      "question": "質問",
+      "answer_html": "HTML形式の回答"
+    }
+  ],
+  "cta_html": "<p>行動喚起のHTML</p>",
+  "schema_org": {
+    "@context": "https://schema.org",
+    "@type": "Article",
+    "headline": "記事タイトル"
+  }
+}
+```
+
+JSONのみを出力してください。""")
 
 
 class PerplexityClient:
     """Perplexity API client"""
 
+    # Constant system prompt shared by all outline/section/finalize calls
+    _SYSTEM_PROMPT: ClassVar[str] = """あなたは日本語の専門ライター兼SEOスペシャリストです。
+
+### 重要なルール:
+1. 必ず日本語で回答してください
+2. 正確で信頼性の高い情報のみを使用
+3. 読みやすく構造化された文章を作成
+4. SEOに最適化された見出し構造を使用
+5. 安全なHTMLタグのみを使用（h2, h3, p, ul, ol, li, strong, em, a）
+6. 誤解を招く情報や推測は避ける
+7. 著作権を侵害しない
+8. 政治的・宗教的な偏見を避ける
+
+### 文章品質基準:
+- 明確で簡潔な表現
+- 論理的な構成
+- 適切な専門用語の使用
+- 読者の理解レベルに合わせた説明
+- 具体例や根拠の提示"""
+
     def __init__(self):
         self.settings = get_settings()
-        self.base_url = "https://api.perplexity.ai/chat/completions"
+        self.base_url = "https://api.perplexity.ai"
         self.headers = {
             "Authorization": f"Bearer {self.settings.pplx_api_key}",
             "Content-Type": "application/json"
         }
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or lazily create the shared pooled HTTP client"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=httpx.Timeout(120.0, connect=5.0),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                http2=True,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client (call on application shutdown)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def _stream_completion(self, body: bytes) -> Dict[str, Any]:
+        """
+        Consume a streamed chat completion as SSE chunks
+
+        Processes `data: {...}` lines incrementally instead of buffering the
+        whole JSON body, keeping peak memory proportional to one chunk rather
+        than the full response during concurrent generations.
+
+        Args:
+            body: Pre-serialized request payload with "stream": true
+
+        Returns:
+            Result dict shaped like the non-streaming response
+        """
+        content_parts: List[str] = []
+        usage: Dict[str, int] = {}
+        model = self.settings.pplx_model
+        finish_reason = "stop"
+
+        async with self._get_client().stream(
+            "POST", "/chat/completions", content=body
+        ) as response:
+            if response.status_code == 429:
+                raise PerplexityRateLimitError(
+                    "Rate limit exceeded",
+                    retry_after=_parse_retry_after(response.headers.get("Retry-After"))
+                )
+
+            if response.status_code != 200:
+                error_detail = (await response.aread()).decode(errors="replace")
+                logger.error(f"Perplexity API error {response.status_code}: {error_detail}")
+                raise PerplexityAPIError(f"API error {response.status_code}: {error_detail}")
+
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+
+                data = line[len("data: "):]
+                if data == "[DONE]":
+                    break
+
+                chunk = orjson.loads(data)
+                choice = chunk["choices"][0]
+
+                delta = choice.get("delta", {}).get("content")
+                if delta:
+                    content_parts.append(delta)
+
+                if choice.get("finish_reason"):
+                    finish_reason = choice["finish_reason"]
+                if chunk.get("usage"):
+                    usage = chunk["usage"]
+                if chunk.get("model"):
+                    model = chunk["model"]
+
+        return {
+            "choices": [{
+                "message": {"content": "".join(content_parts)},
+                "finish_reason": finish_reason
+            }],
+            "usage": usage,
+            "model": model
+        }
 
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
+        stop=stop_after_attempt(6),
+        wait=_wait_with_retry_after,
         retry=retry_if_exception_type((PerplexityRateLimitError, httpx.TimeoutException)),
         before_sleep=before_sleep_log(logger, logging.WARNING)
     )
+    async def _post_completion(self, body: bytes, stream: bool = False) -> Dict[str, Any]:
+        """
+        POST a pre-serialized completion request with retry
+
+        Only the network I/O and error mapping sit inside the retry loop;
+        the payload bytes are built once by the caller and reused verbatim
+        on every attempt.
+
+        Args:
+            body: Pre-serialized request payload
+            stream: Consume the response as SSE chunks instead of one body
+
+        Returns:
+            Result dict shaped like the chat completions response
+        """
+        if stream:
+            return await self._stream_completion(body)
+
+        response = await self._get_client().post("/chat/completions", content=body)
+
+        # Handle rate limiting
+        if response.status_code == 429:
+            raise PerplexityRateLimitError(
+                "Rate limit exceeded",
+                retry_after=_parse_retry_after(response.headers.get("Retry-After"))
+            )
+
+        # Handle other errors
+        if response.status_code != 200:
+            error_detail = response.text
+            logger.error(f"Perplexity API error {response.status_code}: {error_detail}")
+            raise PerplexityAPIError(f"API error {response.status_code}: {error_detail}")
+
+        return orjson.loads(response.content)
+
     async def _call_api(
         self,
         messages: List[Dict[str, str]],
         max_tokens: int = 3500,
         temperature: float = 0.2,
         response_format: Optional[Dict[str, str]] = None,
-        search_domain_filter: Optional[List[str]] = None
+        search_domain_filter: Optional[List[str]] = None,
+        stream: bool = False
     ) -> PerplexityResponse:
         """
         Make API call to Perplexity with retry logic
@@ -74,6 +448,7 @@ class PerplexityClient:
             temperature: Sampling temperature
             response_format: Response format (e.g., {"type": "json_object"})
             search_domain_filter: Domain filter for search
+            stream: Consume the response as SSE chunks instead of one body
 
         Returns:
             PerplexityResponse object
@@ -99,48 +474,37 @@ class PerplexityClient:
         if search_domain_filter and not self.settings.pplx_disable_search:
             payload["search_domain_filter"] = search_domain_filter[:20]  # Max 20 domains
 
-        try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    self.base_url,
-                    headers=self.headers,
-                    json=payload
-                )
-
-                # Handle rate limiting
-                if response.status_code == 429:
-                    raise PerplexityRateLimitError("Rate limit exceeded")
-
-                # Handle other errors
-                if response.status_code != 200:
-                    error_detail = response.text
-                    logger.error(f"Perplexity API error {response.status_code}: {error_detail}")
-                    raise PerplexityAPIError(f"API error {response.status_code}: {error_detail}")
+        if stream:
+            payload["stream"] = True
 
-                result = response.json()
-                choice = result["choices"][0]
+        # Serialize once; _post_completion reuses the same bytes on retries
+        body = orjson.dumps(payload)
 
-                # Calculate latency
-                latency_ms = int((time.time() - start_time) * 1000)
-
-                # Estimate tokens (rough approximation)
-                tokens_estimated = len(choice["message"]["content"]) // 4
-
-                # Log the call
-                log_perplexity_call(
-                    article_id="unknown",  # Will be set by caller
-                    call_type="generation",
-                    tokens_estimated=tokens_estimated,
-                    latency_ms=latency_ms,
-                    success=True
-                )
-
-                return PerplexityResponse(
-                    content=choice["message"]["content"],
-                    usage=result.get("usage", {}),
-                    model=result["model"],
-                    finish_reason=choice["finish_reason"]
-                )
+        try:
+            result = await self._post_completion(body, stream=stream)
+            choice = result["choices"][0]
+
+            # Calculate latency
+            latency_ms = int((time.time() - start_time) * 1000)
+
+            # Estimate tokens (rough approximation)
+            tokens_estimated = len(choice["message"]["content"]) // 4
+
+            # Log the call
+            log_perplexity_call(
+                article_id="unknown",  # Will be set by caller
+                call_type="generation",
+                tokens_estimated=tokens_estimated,
+                latency_ms=latency_ms,
+                success=True
+            )
+
+            return PerplexityResponse(
+                content=choice["message"]["content"],
+                usage=result.get("usage", {}),
+                model=result["model"],
+                finish_reason=choice["finish_reason"]
+            )
 
         except httpx.TimeoutException as e:
             logger.error(f"Perplexity API timeout: {str(e)}")
@@ -172,7 +536,7 @@ class PerplexityClient:
 
         search_domains = None
         if input_data.references:
-            search_domains = [url.host for url in input_data.references]
+            search_domains = list(input_data.search_domains)
 
         response = await self._call_api(
             messages=messages,
@@ -182,10 +546,11 @@ class PerplexityClient:
         )
 
         try:
-            outline = json.loads(response.content)
-            logger.info(f"Generated outline with {len(outline.get('sections', []))} sections")
-            return outline
-        except json.JSONDecodeError as e:
+            outline = _outline_decoder.decode(response.content)
+            logger.info(f"Generated outline with {len(outline.sections)} sections")
+            # Callers work on the plain dict shape
+            return msgspec.to_builtins(outline)
+        except msgspec.DecodeError as e:
             logger.error(f"Failed to parse outline JSON: {response.content}")
             raise PerplexityAPIError(f"Invalid JSON response: {str(e)}")
 
@@ -216,17 +581,56 @@ class PerplexityClient:
 
         search_domains = None
         if input_data.references:
-            search_domains = [url.host for url in input_data.references]
+            search_domains = list(input_data.search_domains)
 
+        # Sections are the largest responses; stream them chunk-by-chunk
         response = await self._call_api(
             messages=messages,
             max_tokens=4000,
-            search_domain_filter=search_domains
+            search_domain_filter=search_domains,
+            stream=True
         )
 
         logger.info(f"Generated section '{section.get('h2', 'Unknown')}' with {len(response.content)} characters")
         return response.content
 
+    async def generate_all_sections(
+        self,
+        input_data: GenerateInput,
+        outline: Dict[str, Any],
+        target_chars_per_section: int = 2000
+    ) -> List[str]:
+        """
+        Generate all section contents concurrently
+
+        Fans out one generate_section call per outline section via
+        asyncio.gather, bounded by a semaphore sized to the Perplexity
+        concurrency quota. Results keep outline order.
+
+        Args:
+            input_data: Article generation input
+            outline: Article outline structure
+            target_chars_per_section: Target character count per section
+
+        Returns:
+            List of HTML section contents in outline order
+        """
+        sections = outline.get("sections", [])
+        if not sections:
+            return []
+
+        sem = asyncio.Semaphore(self.settings.pplx_max_concurrency)
+
+        async def _one(section: Dict[str, Any]) -> str:
+            async with sem:
+                return await self.generate_section(
+                    input_data, section, target_chars_per_section
+                )
+
+        logger.info(f"Generating {len(sections)} sections concurrently "
+                    f"(max {self.settings.pplx_max_concurrency} in flight)")
+        return await asyncio.gather(*[_one(section) for section in sections])
+
     async def finalize_article(
         self,
         input_data: GenerateInput,
@@ -259,84 +663,29 @@ class PerplexityClient:
         )
 
         try:
-            article_data = json.loads(response.content)
+            article_data = _finalize_decoder.decode(response.content)
             logger.info("Finalized article with metadata")
-            return article_data
-        except json.JSONDecodeError as e:
+            return msgspec.to_builtins(article_data)
+        except msgspec.DecodeError as e:
             logger.error(f"Failed to parse finalization JSON: {response.content}")
             raise PerplexityAPIError(f"Invalid JSON response: {str(e)}")
 
     def _build_system_prompt(self) -> str:
         """Build system prompt for Perplexity"""
-        return """あなたは日本語の専門ライター兼SEOスペシャリストです。
-
-### 重要なルール:
-1. 必ず日本語で回答してください
-2. 正確で信頼性の高い情報のみを使用
-3. 読みやすく構造化された文章を作成
-4. SEOに最適化された見出し構造を使用
-5. 安全なHTMLタグのみを使用（h2, h3, p, ul, ol, li, strong, em, a）
-6. 誤解を招く情報や推測は避ける
-7. 著作権を侵害しない
-8. 政治的・宗教的な偏見を避ける
-
-### 文章品質基準:
-- 明確で簡潔な表現
-- 論理的な構成
-- 適切な専門用語の使用
-- 読者の理解レベルに合わせた説明
-- 具体例や根拠の提示"""
+        return self._SYSTEM_PROMPT
 
     def _build_outline_prompt(self, input_data: GenerateInput) -> str:
         """Build outline generation prompt"""
-        references_text = ""
-        if input_data.references:
-            references_text = f"\n参考URL: {', '.join(str(url) for url in input_data.references)}"
-
-        must_topics_text = ""
-        if input_data.must_topics:
-            must_topics_text = f"\n必須トピック: {', '.join(input_data.must_topics)}"
-
-        bans_text = ""
-        if input_data.bans:
-            bans_text = f"\n禁止事項: {', '.join(input_data.bans)}"
-
-        return f"""以下の情報に基づいて記事の見出し構成を作成してください。
-
-### 記事情報:
-要約: {input_data.summary}
-目的: {input_data.goal}
-想定読者: {input_data.audience}
-トーン: {input_data.tone.value}
-目標文字数: {input_data.target_chars}字{references_text}{must_topics_text}{bans_text}
-
-### 要求事項:
-- H2見出しを6-9個作成
-- 各H2に対してH3見出しを2-3個作成
-- 見出しは論理的な順序で配置
-- SEOを意識したキーワード含有
-- 読者の関心を引く魅力的な見出し
-
-### 出力形式:
-以下のJSON形式で出力してください:
-
-```json
-{{
-  "title": "記事タイトル",
-  "sections": [
-    {{
-      "h2": "H2見出し1",
-      "h3": ["H3見出し1-1", "H3見出し1-2"]
-    }},
-    {{
-      "h2": "H2見出し2",
-      "h3": ["H3見出し2-1", "H3見出し2-2", "H3見出し2-3"]
-    }}
-  ]
-}}
-```
+        references_text, must_topics_text, bans_text = _build_context_fragments(
+            *_context_key(input_data)
+        )
 
-JSONのみを出力してください。"""
+        return _OUTLINE_TPL.render(
+            input_data=input_data,
+            references_text=references_text,
+            must_topics_text=must_topics_text,
+            bans_text=bans_text,
+        )
 
     def _build_section_prompt(
         self,
@@ -348,35 +697,15 @@ JSONのみを出力してください。"""
         h2_title = section.get("h2", "")
         h3_titles = section.get("h3", [])
 
-        must_topics_text = ""
-        if input_data.must_topics:
-            must_topics_text = f"\n必須トピック: {', '.join(input_data.must_topics)}"
-
-        return f"""以下の見出し構成に基づいて、詳細なコンテンツを作成してください。
-
-### セクション情報:
-H2見出し: {h2_title}
-H3見出し: {', '.join(h3_titles)}
-
-### 記事コンテキスト:
-要約: {input_data.summary}
-目的: {input_data.goal}
-想定読者: {input_data.audience}
-トーン: {input_data.tone.value}{must_topics_text}
-
-### 要求事項:
-- 目標文字数: 約{target_chars}文字
-- H2, H3見出しを適切に使用
-- 各H3セクションに具体的な内容を記述
-- 論理的で読みやすい構成
-- 専門性と信頼性を重視
-- 具体例や根拠を含める
-
-### 使用可能HTMLタグ:
-h2, h3, p, ul, ol, li, strong, em, a（hrefは信頼できるURLのみ）
+        _, must_topics_text, _ = _build_context_fragments(*_context_key(input_data))
 
-### 出力:
-HTMLコンテンツのみを出力してください。説明文は不要です。"""
+        return _SECTION_TPL.render(
+            input_data=input_data,
+            h2_title=h2_title,
+            h3_text=', '.join(h3_titles),
+            must_topics_text=must_topics_text,
+            target_chars=target_chars,
+        )
 
     def _build_finalization_prompt(
         self,
@@ -385,55 +714,12 @@ HTMLコンテンツのみを出力してください。説明文は不要です
         sections: List[str]
     ) -> str:
         """Build finalization prompt"""
-        content_preview = "\n".join(sections)[:1000] + "..."
-
-        return f"""以下の記事コンテンツに基づいて、完全な記事データを作成してください。
-
-### 元の要求:
-要約: {input_data.summary}
-目的: {input_data.goal}
-想定読者: {input_data.audience}
-
-### 記事コンテンツ概要:
-{content_preview}
-
-### 要求事項:
-- SEOに最適化されたタイトル
-- URLフレンドリーなslug（英数字とハイフンのみ）
-- 魅力的な抜粋文
-- メタディスクリプション（150文字以内）
-- 関連するタグ（最大10個）
-- 適切なカテゴリ（最大5個）
-- FAQ（質問と回答のペア、最大5個）
-- CTA（行動喚起）HTML
-
-### 出力形式:
-以下のJSON形式で出力してください:
-
-```json
-{{
-  "title": "記事タイトル",
-  "slug": "article-slug",
-  "excerpt": "記事の抜粋",
-  "meta_description": "メタディスクリプション",
-  "tags": ["タグ1", "タグ2"],
-  "categories": ["カテゴリ1"],
-  "faq": [
-    {{
-      "question": "質問",
-      "answer_html": "HTML形式の回答"
-    }}
-  ],
-  "cta_html": "<p>行動喚起のHTML</p>",
-  "schema_org": {{
-    "@context": "https://schema.org",
-    "@type": "Article",
-    "headline": "記事タイトル"
-  }}
-}}
-```
+        content_preview = _build_content_preview(sections)
 
-JSONのみを出力してください。"""
+        return _FINALIZE_TPL.render(
+            input_data=input_data,
+            content_preview=content_preview,
+        )
 
 
 # Create global client instance
@@ -1,18 +1,26 @@
 """
 WordPress REST API client
 """
+import asyncio
 import base64
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+import time
+import uuid
+from functools import lru_cache
+from types import MappingProxyType
+from typing import AsyncIterable, Awaitable, Callable, Dict, Any, List, Mapping, Optional, Tuple, Union
 from datetime import datetime
 
 import httpx
+import orjson
 from tenacity import (
-    retry, stop_after_attempt, wait_exponential,
+    retry, stop_after_attempt, wait_exponential_jitter,
     retry_if_exception_type, before_sleep_log
 )
 
-from app.deps import get_settings
+from app.deps import SessionLocal, get_settings
+from app.models import Article
 from app.schemas import PublishRequest
 from app.utils.logging import log_wordpress_call
 
@@ -34,6 +42,103 @@ class WordPressNotFoundError(WordPressAPIError):
     pass
 
 
+class _TransientWPError(WordPressAPIError):
+    """Transient WordPress error (429/5xx) that is safe to retry"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# Statuses that indicate a transient server-side condition, not a bad request
+_TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# TTL for the in-process caches: taxonomy lists change rarely but are read
+# on nearly every publish; posts are cached just long enough to collapse
+# idempotency pre-checks during a retry burst.
+_TAXONOMY_CACHE_TTL = 60.0
+_POST_CACHE_TTL = 5.0
+
+# Jittered exponential backoff so concurrent publishes don't retry in lockstep
+_jitter_wait = wait_exponential_jitter(initial=1.0, max=30.0, jitter=0.5)
+
+
+def _wait_with_retry_after(retry_state) -> float:
+    """Wait callable honoring Retry-After when WordPress provides one"""
+    wait = _jitter_wait(retry_state)
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, _TransientWPError) and exc.retry_after is not None:
+        return max(wait, exc.retry_after)
+    return wait
+
+
+@lru_cache(maxsize=8)
+def _basic_credential(username: str, password: str) -> str:
+    """Base64 Basic-auth credential, encoded once per (username, password)"""
+    return base64.b64encode(f"{username}:{password}".encode()).decode()
+
+
+def _error_detail(response: httpx.Response, limit: int = 2048) -> str:
+    """Decode an error body once, truncated so huge error pages can't flood logs"""
+    return response.content[:limit].decode("utf-8", "replace")
+
+
+def _parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Parse a numeric Retry-After header, if present"""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class _CircuitBreaker:
+    """Fail fast once WordPress is clearly down
+
+    The semaphore bounds how many requests run at once; this bounds how
+    many run at all during an outage. After a run of consecutive
+    transient failures the circuit opens and callers get an immediate
+    error instead of stacking up timeouts; after a cooldown one probe
+    request is let through and a success closes the circuit again.
+    Accessed only from event-loop callbacks, so no lock is needed.
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0):
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    def check(self) -> None:
+        """Raise immediately if the circuit is open (allowing one probe)"""
+        if self._opened_at is None:
+            return
+        if time.monotonic() - self._opened_at >= self._cooldown:
+            # Half-open: let this caller probe; one more failure reopens
+            self._opened_at = None
+            self._failures = self._failure_threshold - 1
+            return
+        raise WordPressAPIError(
+            "WordPress circuit breaker open; skipping request"
+        )
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self._failure_threshold:
+            if self._opened_at is None:
+                logger.error(
+                    "WordPress circuit breaker opened after %d consecutive "
+                    "transient failures", self._failures
+                )
+            self._opened_at = time.monotonic()
+
+
 class WordPressClient:
     """WordPress REST API client"""
 
@@ -41,98 +146,284 @@ class WordPressClient:
         self.settings = get_settings()
         self.base_url = f"{self.settings.wp_base_url.rstrip('/')}/wp-json/wp/v2"
         self.headers = self._get_auth_headers()
+        # Pre-joined URLs for the fixed endpoints, so the hot path skips
+        # per-call f-string/lstrip work ("" maps to the API root)
+        self._urls = {
+            name: f"{self.base_url}/{name}" if name else self.base_url
+            for name in ("posts", "categories", "tags", "media", "")
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+        self._wp_sem: Optional[asyncio.Semaphore] = None
+        self._breaker = _CircuitBreaker()
+        # Short-TTL response cache with per-key stampede locks
+        self._ttl_cache: Dict[str, Tuple[float, Any]] = {}
+        self._ttl_locks: Dict[str, asyncio.Lock] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or lazily create the shared pooled HTTP client"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                # Explicit Accept-Encoding so large taxonomy/list JSON comes
+                # back compressed (brotli when the server supports it)
+                headers={**self.headers, "Accept-Encoding": "gzip, deflate, br"},
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=300,
+                ),
+                http2=True,
+            )
+        return self._client
 
-    def _get_auth_headers(self) -> Dict[str, str]:
-        """Get authentication headers for WordPress API"""
-        credentials = f"{self.settings.wp_username}:{self.settings.wp_application_password}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get or lazily create the global concurrency bound
 
-        return {
+        Created on first use so it binds to the running event loop; a single
+        article fanning out many tag creations can't monopolize the keepalive
+        pool or trigger per-IP rate limiting on the WordPress host.
+        """
+        if self._wp_sem is None:
+            self._wp_sem = asyncio.Semaphore(self.settings.wp_max_concurrency)
+        return self._wp_sem
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client (call on application shutdown)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._wp_sem = None
+
+    def _get_auth_headers(self) -> Mapping[str, str]:
+        """Get authentication headers for WordPress API (immutable, built once)"""
+        encoded_credentials = _basic_credential(
+            self.settings.wp_username, self.settings.wp_application_password
+        )
+
+        return MappingProxyType({
             "Authorization": f"Basic {encoded_credentials}",
             "Content-Type": "application/json",
             "User-Agent": "AutoWordPressPost/1.0"
-        }
+        })
+
+    def _url_for(self, endpoint: str) -> str:
+        """Resolve an endpoint to a full URL, precomputed for the fixed ones"""
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = f"{self.base_url}/{endpoint}"
+        return url
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=8),
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.ConnectError)),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
+        wait=_wait_with_retry_after,
+        retry=retry_if_exception_type((httpx.TransportError, _TransientWPError)),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
     )
-    async def _make_request(
+    async def _make_request_raw(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
         """
-        Make authenticated request to WordPress API
+        Make authenticated request to WordPress API and return the raw response
 
         Args:
             method: HTTP method
             endpoint: API endpoint (relative to base_url)
             data: Request data for POST/PUT
             params: Query parameters
+            headers: Extra per-call headers merged over the client defaults
 
         Returns:
-            Response data
+            Raw HTTP response (after status handling)
 
         Raises:
             WordPressAPIError: API error
             WordPressAuthError: Authentication error
             WordPressNotFoundError: Resource not found
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        url = self._url_for(endpoint)
+        self._breaker.check()
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.request(
+            # orjson serializes straight to bytes, skipping the stdlib
+            # str -> bytes encode that client.request(json=...) would do
+            content = orjson.dumps(data) if data is not None else None
+            async with self._get_semaphore():
+                response = await self._get_client().request(
                     method=method,
                     url=url,
-                    headers=self.headers,
-                    json=data,
-                    params=params
+                    content=content,
+                    params=params,
+                    headers=headers
                 )
 
-                # Handle authentication errors
-                if response.status_code == 401:
-                    raise WordPressAuthError("WordPress authentication failed")
+            # Handle authentication errors
+            if response.status_code == 401:
+                raise WordPressAuthError("WordPress authentication failed")
 
-                # Handle not found errors
-                if response.status_code == 404:
-                    raise WordPressNotFoundError(f"WordPress resource not found: {endpoint}")
+            # Handle not found errors
+            if response.status_code == 404:
+                raise WordPressNotFoundError(f"WordPress resource not found: {endpoint}")
 
-                # Handle other client errors
-                if 400 <= response.status_code < 500:
-                    error_detail = response.text
-                    logger.error(f"WordPress API client error {response.status_code}: {error_detail}")
-                    raise WordPressAPIError(f"Client error {response.status_code}: {error_detail}")
+            # Transient overload / rate-limit responses are retried with backoff
+            if response.status_code in _TRANSIENT_STATUS_CODES:
+                retry_after = _parse_retry_after(response)
+                logger.warning(
+                    "WordPress API transient error %s (retry_after=%s)",
+                    response.status_code, retry_after
+                )
+                self._breaker.record_failure()
+                raise _TransientWPError(
+                    f"Transient error {response.status_code}: "
+                    f"{_error_detail(response)}",
+                    retry_after=retry_after
+                )
 
-                # Handle server errors
-                if response.status_code >= 500:
-                    error_detail = response.text
-                    logger.error(f"WordPress API server error {response.status_code}: {error_detail}")
-                    raise WordPressAPIError(f"Server error {response.status_code}: {error_detail}")
+            # Handle other client errors (not retryable)
+            if 400 <= response.status_code < 500:
+                error_detail = _error_detail(response)
+                logger.error(
+                    "WordPress API client error %s: %s",
+                    response.status_code, error_detail
+                )
+                raise WordPressAPIError(f"Client error {response.status_code}: {error_detail}")
+
+            # Handle remaining server errors
+            if response.status_code >= 500:
+                error_detail = _error_detail(response)
+                logger.error(
+                    "WordPress API server error %s: %s",
+                    response.status_code, error_detail
+                )
+                raise WordPressAPIError(f"Server error {response.status_code}: {error_detail}")
 
-                return response.json()
+            self._breaker.record_success()
+            return response
 
         except httpx.TimeoutException as e:
             logger.error(f"WordPress API timeout: {str(e)}")
+            self._breaker.record_failure()
+            raise
+        except httpx.TransportError:
+            self._breaker.record_failure()
             raise
         except httpx.RequestError as e:
             logger.error(f"WordPress API request error: {str(e)}")
             raise WordPressAPIError(f"Request error: {str(e)}")
 
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Make authenticated request to WordPress API
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint (relative to base_url)
+            data: Request data for POST/PUT
+            params: Query parameters
+            headers: Extra per-call headers merged over the client defaults
+
+        Returns:
+            Response data
+        """
+        response = await self._make_request_raw(
+            method, endpoint, data=data, params=params, headers=headers
+        )
+        return orjson.loads(response.content)
+
+    async def _paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every page of a WordPress collection endpoint
+
+        Page 1 is fetched first to learn the total page count from the
+        X-WP-TotalPages header; remaining pages are fetched concurrently
+        over the shared pooled client, bounded to 10 in flight.
+
+        Args:
+            endpoint: Collection endpoint (e.g. "categories")
+            params: Extra query parameters
+
+        Returns:
+            Concatenated items from all pages
+        """
+        base_params = {**(params or {}), "per_page": 100}
+
+        first = await self._make_request_raw("GET", endpoint, params={**base_params, "page": 1})
+        items: List[Dict[str, Any]] = orjson.loads(first.content)
+
+        total_pages = int(first.headers.get("X-WP-TotalPages", "1"))
+        if total_pages <= 1:
+            return items
+
+        semaphore = asyncio.Semaphore(10)
+
+        async def fetch_page(page: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._make_request("GET", endpoint, params={**base_params, "page": page})
+
+        pages = await asyncio.gather(*[fetch_page(p) for p in range(2, total_pages + 1)])
+        for page_items in pages:
+            items.extend(page_items)
+
+        return items
+
+    async def _cached(
+        self,
+        key: str,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Serve from the TTL cache or fetch under a per-key lock
+
+        The lock guarantees a single upstream fetch per key even when many
+        callers miss simultaneously (cache-stampede guard).
+        """
+        hit = self._ttl_cache.get(key)
+        if hit and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+
+        lock = self._ttl_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Re-check: another waiter may have refreshed the entry
+            hit = self._ttl_cache.get(key)
+            if hit and time.monotonic() - hit[0] < ttl:
+                return hit[1]
+
+            value = await fetch()
+            self._ttl_cache[key] = (time.monotonic(), value)
+            return value
+
+    def _invalidate_cache(self, key: str) -> None:
+        """Drop a cached entry (after a mutation of the underlying data)"""
+        self._ttl_cache.pop(key, None)
+
     async def get_categories(self) -> List[Dict[str, Any]]:
         """
-        Get all categories from WordPress
+        Get all categories from WordPress (cached for a short TTL)
 
         Returns:
             List of category objects
         """
         try:
-            response = await self._make_request("GET", "categories", params={"per_page": 100})
+            response = await self._cached(
+                "categories", _TAXONOMY_CACHE_TTL,
+                lambda: self._paginate("categories")
+            )
             logger.info(f"Retrieved {len(response)} categories from WordPress")
             return response
 
@@ -142,13 +433,16 @@ class WordPressClient:
 
     async def get_tags(self) -> List[Dict[str, Any]]:
         """
-        Get all tags from WordPress
+        Get all tags from WordPress (cached for a short TTL)
 
         Returns:
             List of tag objects
         """
         try:
-            response = await self._make_request("GET", "tags", params={"per_page": 100})
+            response = await self._cached(
+                "tags", _TAXONOMY_CACHE_TTL,
+                lambda: self._paginate("tags")
+            )
             logger.info(f"Retrieved {len(response)} tags from WordPress")
             return response
 
@@ -178,6 +472,7 @@ class WordPressClient:
 
         try:
             response = await self._make_request("POST", "categories", data=data)
+            self._invalidate_cache("categories")
             logger.info(f"Created category '{name}' with ID {response['id']}")
             log_wordpress_call("unknown", "create_category", success=True, name=name)
             return response
@@ -208,6 +503,7 @@ class WordPressClient:
 
         try:
             response = await self._make_request("POST", "tags", data=data)
+            self._invalidate_cache("tags")
             logger.info(f"Created tag '{name}' with ID {response['id']}")
             log_wordpress_call("unknown", "create_tag", success=True, name=name)
             return response
@@ -216,6 +512,18 @@ class WordPressClient:
             log_wordpress_call("unknown", "create_tag", success=False, error=str(e), name=name)
             raise
 
+    def _get_existing_wp_post_id(self, article_id: str) -> Optional[int]:
+        """Look up a previously recorded WordPress post ID for an article"""
+        db = SessionLocal()
+        try:
+            article = db.query(Article).filter(Article.id == article_id).first()
+            return article.wp_post_id if article else None
+        except Exception as e:
+            logger.warning(f"Idempotency pre-check failed for {article_id}: {str(e)}")
+            return None
+        finally:
+            db.close()
+
     async def create_post(
         self,
         article_id: str,
@@ -249,6 +557,22 @@ class WordPressClient:
         Returns:
             Created post object
         """
+        # Retries after a timeout can land on a WordPress that already
+        # accepted the first attempt. Short-circuit when the local Article
+        # already records a post ID, and send a deterministic
+        # Idempotency-Key (also stored in post meta) so the duplicate can
+        # be detected server-side or via a meta query.
+        existing_post_id = self._get_existing_wp_post_id(article_id)
+        if existing_post_id is not None:
+            logger.info(
+                f"Article {article_id} already published as WordPress post "
+                f"{existing_post_id}, skipping create"
+            )
+            return await self.get_post(existing_post_id)
+
+        title_hash = hashlib.sha256(title.encode()).hexdigest()
+        idem_key = uuid.uuid5(uuid.NAMESPACE_URL, f"{article_id}:{title_hash}").hex
+
         data = {
             "title": title,
             "content": content,
@@ -265,8 +589,7 @@ class WordPressClient:
         if tags:
             data["tags"] = tags
 
-        if meta:
-            data["meta"] = meta
+        data["meta"] = {**(meta or {}), "idempotency_key": idem_key}
 
         if featured_media:
             data["featured_media"] = featured_media
@@ -275,7 +598,10 @@ class WordPressClient:
             data["date"] = date
 
         try:
-            response = await self._make_request("POST", "posts", data=data)
+            response = await self._make_request(
+                "POST", "posts", data=data,
+                headers={"Idempotency-Key": idem_key}
+            )
             wp_post_id = response["id"]
             wp_url = response["link"]
 
@@ -310,6 +636,7 @@ class WordPressClient:
         """
         try:
             response = await self._make_request("POST", f"posts/{post_id}", data=kwargs)
+            self._invalidate_cache(f"post:{post_id}")
             logger.info(f"Updated WordPress post ID {post_id} for article {article_id}")
             log_wordpress_call(article_id, "update_post", wp_post_id=post_id, success=True)
             return response
@@ -334,6 +661,7 @@ class WordPressClient:
 
         try:
             response = await self._make_request("DELETE", f"posts/{post_id}", params=params)
+            self._invalidate_cache(f"post:{post_id}")
             logger.info(f"Deleted WordPress post ID {post_id} for article {article_id}")
             log_wordpress_call(article_id, "delete_post", wp_post_id=post_id, success=True)
             return response
@@ -345,59 +673,76 @@ class WordPressClient:
     async def upload_media(
         self,
         article_id: str,
-        file_data: bytes,
+        file_data: Union[bytes, AsyncIterable[bytes]],
         filename: str,
         mime_type: str,
         title: Optional[str] = None,
-        alt_text: Optional[str] = None
+        alt_text: Optional[str] = None,
+        content_length: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Upload media file to WordPress
 
+        An async iterable of chunks is streamed with chunked transfer
+        encoding, so memory use stays bounded regardless of file size;
+        plain bytes are still accepted for small payloads.
+
         Args:
             article_id: Internal article ID for logging
-            file_data: File binary data
+            file_data: File binary data or an async iterable of chunks
             filename: Original filename
             mime_type: File MIME type
             title: Media title
             alt_text: Alt text for images
+            content_length: Total size in bytes (required to set
+                Content-Length when streaming; inferred for bytes)
 
         Returns:
             Uploaded media object
         """
-        headers = self._get_auth_headers()
-        headers["Content-Type"] = mime_type
-        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        headers = {
+            "Content-Type": mime_type,
+            "Content-Disposition": f'attachment; filename="{filename}"',
+        }
+        if isinstance(file_data, bytes):
+            content_length = len(file_data)
+        if content_length is not None:
+            headers["Content-Length"] = str(content_length)
+
+        # Uploads respect an open circuit too, though failure accounting
+        # stays in _make_request_raw where statuses are classified
+        self._breaker.check()
 
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/media",
+            async with self._get_semaphore():
+                response = await self._get_client().post(
+                    self._urls["media"],
                     headers=headers,
-                    content=file_data
+                    content=file_data,
+                    timeout=httpx.Timeout(120.0, connect=10.0)
                 )
 
-                if response.status_code != 201:
-                    error_detail = response.text
-                    raise WordPressAPIError(f"Media upload failed {response.status_code}: {error_detail}")
+            if response.status_code != 201:
+                error_detail = _error_detail(response)
+                raise WordPressAPIError(f"Media upload failed {response.status_code}: {error_detail}")
 
-                media_data = response.json()
-                media_id = media_data["id"]
+            media_data = orjson.loads(response.content)
+            media_id = media_data["id"]
 
-                # Update media metadata if provided
-                if title or alt_text:
-                    update_data = {}
-                    if title:
-                        update_data["title"] = title
-                    if alt_text:
-                        update_data["alt_text"] = alt_text
+            # Update media metadata if provided
+            if title or alt_text:
+                update_data = {}
+                if title:
+                    update_data["title"] = title
+                if alt_text:
+                    update_data["alt_text"] = alt_text
 
-                    await self._make_request("POST", f"media/{media_id}", data=update_data)
+                await self._make_request("POST", f"media/{media_id}", data=update_data)
 
-                logger.info(f"Uploaded media ID {media_id} for article {article_id}")
-                log_wordpress_call(article_id, "upload_media", success=True, media_id=media_id)
+            logger.info(f"Uploaded media ID {media_id} for article {article_id}")
+            log_wordpress_call(article_id, "upload_media", success=True, media_id=media_id)
 
-                return media_data
+            return media_data
 
         except Exception as e:
             log_wordpress_call(article_id, "upload_media", success=False, error=str(e))
@@ -413,7 +758,10 @@ class WordPressClient:
         Returns:
             Post object
         """
-        return await self._make_request("GET", f"posts/{post_id}")
+        return await self._cached(
+            f"post:{post_id}", _POST_CACHE_TTL,
+            lambda: self._make_request("GET", f"posts/{post_id}")
+        )
 
     async def search_posts(self, search: str, per_page: int = 10) -> List[Dict[str, Any]]:
         """
@@ -454,13 +802,25 @@ class WordPressClient:
             True if connection successful
         """
         try:
-            await self._make_request("GET", "")
-            logger.info("WordPress API connection test successful")
+            response = await self._make_request_raw("GET", "")
+            logger.info(
+                "WordPress API connection test successful "
+                f"({response.http_version})"
+            )
             return True
         except Exception as e:
             logger.error(f"WordPress API connection test failed: {str(e)}")
             return False
 
 
-# Create global client instance
-wordpress_client = WordPressClient()
\ No newline at end of file
+@lru_cache()
+def get_wordpress_client() -> WordPressClient:
+    """Get the process-wide WordPress client, created lazily on first use
+
+    Nothing is constructed at import time, so the pooled AsyncClient binds
+    to whichever event loop first uses it (FastAPI's loop in the API
+    process, the task loop in Celery workers). FastAPI handlers can take it
+    via Depends(get_wordpress_client); tests can clear the cache to inject
+    a fresh instance.
+    """
+    return WordPressClient()
\ No newline at end of file
@@ -1,12 +1,17 @@
 """
 Dependency injection and configuration management
 """
+import asyncio
 import os
 from functools import lru_cache
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
-from pydantic import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine, AsyncSession, async_scoped_session, async_sessionmaker,
+    create_async_engine
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 
@@ -14,6 +19,14 @@ from sqlalchemy.orm import sessionmaker, Session
 class Settings(BaseSettings):
     """Application settings"""
 
+    # frozen=True makes the cached instance safely shareable across threads
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        frozen=True,
+        extra="ignore",
+    )
+
     # Application
     app_host: str = "0.0.0.0"
     app_port: int = 8080
@@ -22,6 +35,7 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    migration_mode: str = "sync"  # sync | async | skip
 
     # Redis
     redis_url: str
@@ -30,18 +44,19 @@ class Settings(BaseSettings):
     pplx_api_key: str
     pplx_model: str = "sonar-pro"
     pplx_disable_search: bool = True
+    pplx_max_concurrency: int = 5
 
     # WordPress
     wp_base_url: str
     wp_username: str
     wp_application_password: str
+    wp_max_concurrency: int = 8
+    # End-to-end budget for one publish pipeline (taxonomies + POST)
+    wp_publish_deadline: float = 45.0
 
     # Logging
     log_level: str = "INFO"
 
-    class Config:
-        env_file = ".env"
-
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -49,21 +64,100 @@ def get_settings() -> Settings:
     return Settings()
 
 
-# Database setup
-settings = get_settings()
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_recycle=300,
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Database setup. Engine and sessionmaker are built lazily so importing
+# this module (e.g. from models or tests) never opens a DB connection, and
+# each forked worker process builds its own pool on first use.
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
-    """Database dependency"""
+@lru_cache()
+def get_engine():
+    """Get cached database engine (created on first use)"""
+    settings = get_settings()
+    return create_engine(
+        settings.database_url,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        pool_size=20,
+        max_overflow=40,
+        # Larger compiled-SQL LRU so hot statements never recompile
+        query_cache_size=1200,
+        future=True,
+    )
+
+
+@lru_cache()
+def get_sessionmaker() -> sessionmaker:
+    """Get cached session factory bound to the lazy engine"""
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=get_engine(),
+        expire_on_commit=False,
+        future=True,
+    )
+
+
+def SessionLocal() -> Session:
+    """Create a new database session (kept callable for existing callers)"""
+    return get_sessionmaker()()
+
+
+def get_sync_db() -> Generator[Session, None, None]:
+    """Synchronous database dependency (Celery workers and scripts)"""
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# Async engine for the FastAPI request path: DB round-trips no longer block
+# the event loop, so requests can interleave DB, Perplexity and WordPress
+# I/O. Workers keep the synchronous engine above.
+@lru_cache()
+def get_async_engine() -> AsyncEngine:
+    """Get cached async database engine (asyncpg driver)"""
+    settings = get_settings()
+    url = settings.database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return create_async_engine(
+        url,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        pool_size=20,
+        max_overflow=40,
+        query_cache_size=1200,
+    )
+
+
+@lru_cache()
+def get_async_sessionmaker() -> async_sessionmaker:
+    """Get cached async session factory bound to the async engine"""
+    return async_sessionmaker(
+        get_async_engine(),
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+
+
+@lru_cache()
+def get_scoped_session() -> async_scoped_session:
+    """Get the task-scoped session registry for the request path
+
+    Scoping on the current asyncio task means every dependency resolution
+    inside one request reuses the same session (and pooled connection)
+    instead of building and disposing a fresh one each time.
+    """
+    return async_scoped_session(
+        get_async_sessionmaker(),
+        scopefunc=asyncio.current_task,
+    )
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Database dependency for request handlers"""
+    registry = get_scoped_session()
+    try:
+        yield registry()
+    finally:
+        await registry.remove()
\ No newline at end of file
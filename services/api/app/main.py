@@ -1,26 +1,121 @@
 """
 Auto WordPress Post Generator - Main FastAPI Application
 """
+import asyncio
+import logging
 import os
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Dict, Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.deps import get_settings
 from app.routes import articles, taxonomies
 from app.utils.logging import setup_logging
 
+logger = logging.getLogger(__name__)
+
+# Tracked so /healthz/migrations can report progress of async migrations
+_migration_state: Dict[str, Optional[str]] = {"status": "pending", "error": None}
+
+
+def _run_migrations() -> None:
+    """Run Alembic migrations up to head (blocking)"""
+    from alembic import command
+    from alembic.config import Config
+
+    _migration_state["status"] = "running"
+    try:
+        command.upgrade(Config("alembic.ini"), "head")
+        _migration_state["status"] = "succeeded"
+    except Exception as e:
+        _migration_state["status"] = "failed"
+        _migration_state["error"] = str(e)
+        raise
+
+
+async def _warmup_wordpress(app: FastAPI) -> None:
+    """Warm the WordPress connection pool and taxonomy cache before traffic
+
+    Failures are logged, not fatal: the app still serves requests during a
+    WordPress outage, the first real request just pays the cold-start cost.
+    """
+    from app.clients.wp_client import get_wordpress_client
+
+    wordpress_client = get_wordpress_client()
+    app.state.wp = wordpress_client
+    try:
+        if not await wordpress_client.test_connection():
+            logger.warning("WordPress warmup: connection test failed")
+            return
+
+        categories, tags = await asyncio.gather(
+            wordpress_client.get_categories(),
+            wordpress_client.get_tags(),
+        )
+        app.state.wp_taxonomies = {"categories": categories, "tags": tags}
+        logger.info(
+            f"WordPress warmup complete: {len(categories)} categories, "
+            f"{len(tags)} tags cached"
+        )
+    except Exception as e:
+        logger.warning(f"WordPress warmup failed: {str(e)}")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan events"""
     # Startup
     setup_logging()
+
+    # Redis-backed response cache for read-heavy endpoints (taxonomies,
+    # previews). from_url is lazy, so a Redis outage surfaces on first use
+    # rather than blocking startup.
+    from fastapi_cache import FastAPICache
+    from fastapi_cache.backends.redis import RedisBackend
+    from redis import asyncio as aioredis
+    FastAPICache.init(
+        RedisBackend(aioredis.from_url(get_settings().redis_url)),
+        prefix="awp",
+    )
+
+    # Warm the keepalive pool and taxonomy cache so the first user request
+    # doesn't pay TLS + auth + a full per_page=100 pull.
+    app.state.wp_taxonomies = None
+    await _warmup_wordpress(app)
+
+    # Batched Celery dispatch: amortizes broker round-trips under burst load
+    from app.workers.dispatch import task_dispatcher
+    await task_dispatcher.start()
+
+    # Micro-batched article creation for bursty /generate traffic
+    from app.services.generate_batch import generate_batcher
+    await generate_batcher.start()
+
+    # Migrations don't have to block startup: in async mode the app begins
+    # serving (and answering health checks) while DDL runs in the background.
+    settings = get_settings()
+    if settings.migration_mode == "sync":
+        _run_migrations()
+    elif settings.migration_mode == "async":
+        asyncio.create_task(asyncio.to_thread(_run_migrations))
+    else:
+        _migration_state["status"] = "skipped"
+        logger.info("Skipping migrations (MIGRATION_MODE=skip)")
+
     yield
     # Shutdown
+    from app.clients.pplx_client import perplexity_client
+    from app.clients.wp_client import get_wordpress_client
+    from app.deps import get_async_engine, get_engine
+    await generate_batcher.stop()
+    await task_dispatcher.stop()
+    await perplexity_client.close()
+    await get_wordpress_client().close()
+    await get_async_engine().dispose()
+    get_engine().dispose()
 
 
 def create_app() -> FastAPI:
@@ -34,6 +129,7 @@ def create_app() -> FastAPI:
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Middleware
@@ -71,11 +167,42 @@ def create_app() -> FastAPI:
         """Health check endpoint"""
         return {"status": "healthy", "service": "auto-wordpress-post"}
 
-    # Global exception handler
+    @app.get("/healthz/migrations")
+    async def migrations_health():
+        """Report background migration progress"""
+        return {"mode": settings.migration_mode, **_migration_state}
+
+    # Exception handlers: map upstream WordPress failures to meaningful
+    # statuses so clients stop retrying unrecoverable errors, and keep a
+    # last-resort 500 handler. Expected 4xx paths are not logged as errors.
+    from app.clients.wp_client import (
+        WordPressAPIError, WordPressAuthError, WordPressNotFoundError
+    )
+
+    def _error_response(exc: Exception, status_code: int) -> ORJSONResponse:
+        return ORJSONResponse(
+            status_code=status_code,
+            content={"detail": str(exc), "type": type(exc).__name__}
+        )
+
+    @app.exception_handler(WordPressAuthError)
+    async def wp_auth_error_handler(request, exc):
+        return _error_response(exc, 401)
+
+    @app.exception_handler(WordPressNotFoundError)
+    async def wp_not_found_handler(request, exc):
+        return _error_response(exc, 404)
+
+    @app.exception_handler(WordPressAPIError)
+    async def wp_api_error_handler(request, exc):
+        # Upstream failure, not an application bug
+        return _error_response(exc, 502)
+
     @app.exception_handler(Exception)
     async def global_exception_handler(request, exc):
         """Global exception handler"""
-        return JSONResponse(
+        logger.exception("Unhandled exception while serving request")
+        return ORJSONResponse(
             status_code=500,
             content={"detail": "Internal server error"}
         )
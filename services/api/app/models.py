@@ -7,10 +7,11 @@ from enum import Enum
 from typing import Dict, Any, Optional
 
 from sqlalchemy import (
-    Column, String, Integer, Text, DateTime, JSON,
-    Enum as SQLEnum, Boolean, UniqueConstraint
+    Column, String, Integer, Text, DateTime,
+    Enum as SQLEnum, Boolean, Index, UniqueConstraint, text
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import BYTEA, UUID, JSONB
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 
 from app.deps import Base
@@ -52,22 +53,37 @@ class Article(Base):
     __tablename__ = "articles"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    input_payload = Column(JSON, nullable=False)
-    output_payload = Column(JSON, nullable=True)
-    status = Column(SQLEnum(ArticleStatus), default=ArticleStatus.PENDING, nullable=False)
+    # The JSON payloads dominate row size (~10KB+); deferring them keeps
+    # control-plane reads (publish/delete status checks) to the slim
+    # columns. Content reads opt back in with undefer_group("payloads").
+    input_payload = deferred(Column(JSONB, nullable=False), group="payloads")
+    output_payload = deferred(Column(JSONB, nullable=True), group="payloads")
+    # Output with all HTML fields sanitized once at generation time, so
+    # read paths skip per-request bleach work
+    sanitized_payload = deferred(Column(JSONB, nullable=True), group="payloads")
+    status = Column(
+        SQLEnum(ArticleStatus, native_enum=False, length=16),
+        default=ArticleStatus.PENDING, nullable=False
+    )
     slug = Column(String(255), unique=True, nullable=True)
     char_count = Column(Integer, default=0)
-    idempotency_key = Column(String(64), unique=True, nullable=True)
+    # Raw sha256 digest (32 bytes); half the footprint of the old hex string
+    idempotency_key = Column(BYTEA, unique=True, nullable=True)
     wp_post_id = Column(Integer, nullable=True)
     wp_url = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # Status polling: WHERE status = ? ORDER BY created_at
+        Index("ix_articles_status_created", "status", "created_at"),
+    )
+
     def __repr__(self) -> str:
         return f"<Article(id={self.id}, status={self.status})>"
 
     @classmethod
-    def create_from_input(cls, input_data: Dict[str, Any], idempotency_key: Optional[str] = None) -> "Article":
+    def create_from_input(cls, input_data: Dict[str, Any], idempotency_key: Optional[bytes] = None) -> "Article":
         """Create new article from input data"""
         return cls(
             input_payload=input_data,
@@ -95,15 +111,27 @@ class Job(Base):
     __tablename__ = "jobs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    type = Column(SQLEnum(JobType), nullable=False)
-    payload = Column(JSON, nullable=False)
-    status = Column(SQLEnum(JobStatus), default=JobStatus.PENDING, nullable=False)
+    type = Column(SQLEnum(JobType, native_enum=False, length=16), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    status = Column(
+        SQLEnum(JobStatus, native_enum=False, length=16),
+        default=JobStatus.PENDING, nullable=False
+    )
     tries = Column(Integer, default=0)
     last_error = Column(Text, nullable=True)
-    result = Column(JSON, nullable=True)
+    result = Column(JSONB, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # Partial composite index for the dispatch query; only the hot
+        # PENDING/RUNNING rows are indexed so it stays tiny.
+        Index(
+            "ix_jobs_status_type_created", "status", "type", "created_at",
+            postgresql_where=text("status IN ('PENDING', 'RUNNING')"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Job(id={self.id}, type={self.type}, status={self.status})>"
 
@@ -129,7 +157,7 @@ class Taxonomy(Base):
     __tablename__ = "taxonomies"
 
     id = Column(Integer, primary_key=True)
-    type = Column(SQLEnum(TaxonomyType), nullable=False)
+    type = Column(SQLEnum(TaxonomyType, native_enum=False, length=16), nullable=False)
     name = Column(String(255), nullable=False)
     slug = Column(String(255), nullable=False)
     wp_id = Column(Integer, unique=True, nullable=True)
@@ -140,6 +168,12 @@ class Taxonomy(Base):
     __table_args__ = (
         UniqueConstraint('type', 'name', name='unique_type_name'),
         UniqueConstraint('type', 'slug', name='unique_type_slug'),
+        # Every lookup filters by type plus name or wp_id; unique_type_name
+        # already backs the name path, this covers the wp_id path.
+        Index(
+            "ix_taxonomies_type_wp_id", "type", "wp_id",
+            postgresql_where=text("wp_id IS NOT NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
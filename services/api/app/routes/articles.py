@@ -6,17 +6,20 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi_cache import FastAPICache
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
 from app.deps import get_db
+from app.services.generate_batch import generate_batcher
 from app.models import Article, ArticleStatus
 from app.schemas import (
     GenerateInput, GenerateResponse, ArticleResponse,
     PublishRequest, PublishResponse, ErrorResponse
 )
-from app.workers.tasks_generate import task_generate_article, generate_idempotency_key
-from app.workers.tasks_publish import task_publish_article
-from app.services.sanitizer import count_ja_chars_from_html, sanitize_html
+from app.workers.dispatch import task_dispatcher
+from app.workers.tasks_generate import generate_idempotency_key
+from app.services.sanitizer import count_ja_chars_from_html, sanitize_output_payload
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -29,52 +32,43 @@ logger = logging.getLogger(__name__)
     summary="Generate article content",
     description="Start article generation process using Perplexity API"
 )
-async def generate_article(
-    input_data: GenerateInput,
-    db: Session = Depends(get_db)
-) -> GenerateResponse:
+async def generate_article(input_data: GenerateInput) -> GenerateResponse:
     """Generate article from input summary"""
     try:
         # Generate idempotency key
-        idempotency_key = generate_idempotency_key(input_data.dict())
-
-        # Check for existing article with same input
-        existing_article = db.query(Article).filter(
-            Article.idempotency_key == idempotency_key
-        ).first()
+        # One model_dump shared by key derivation and row creation;
+        # mode="json" keeps the payload JSONB-ready (HttpUrl -> str)
+        input_payload = input_data.model_dump(mode="json")
+        idempotency_key = generate_idempotency_key(input_payload)
+
+        # Coalesced create-or-fetch: requests arriving within the batching
+        # window share one INSERT .. ON CONFLICT round-trip (the batcher
+        # keeps the single-statement dedup semantics).
+        article_id, status_value, created = await generate_batcher.submit(
+            idempotency_key, input_payload
+        )
 
-        if existing_article:
-            logger.info(f"Returning existing article {existing_article.id} for idempotency key {idempotency_key}")
+        if not created:
+            logger.info(f"Returning existing article {article_id} for idempotency key {idempotency_key.hex()}")
             return GenerateResponse(
-                article_id=str(existing_article.id),
-                status=existing_article.status.value,
+                article_id=str(article_id),
+                status=status_value,
                 message="Article with same input already exists"
             )
 
-        # Create new article
-        article = Article.create_from_input(
-            input_data=input_data.dict(),
-            idempotency_key=idempotency_key
-        )
-
-        db.add(article)
-        db.commit()
-        db.refresh(article)
-
-        # Start generation task
-        task_generate_article.delay(str(article.id))
+        # Start generation task (batched broker publish)
+        await task_dispatcher.enqueue("generate.article", [str(article_id)])
 
-        logger.info(f"Started article generation for {article.id}")
+        logger.info(f"Started article generation for {article_id}")
 
         return GenerateResponse(
-            article_id=str(article.id),
-            status=article.status.value,
+            article_id=str(article_id),
+            status=status_value,
             message="Article generation started"
         )
 
     except Exception as e:
         logger.error(f"Failed to start article generation: {str(e)}")
-        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to start article generation"
@@ -89,10 +83,14 @@ async def generate_article(
 )
 async def get_article(
     article_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> ArticleResponse:
     """Get article by ID"""
-    article = db.query(Article).filter(Article.id == article_id).first()
+    # Session.get hits the identity map and the compiled PK-SELECT cache;
+    # this route renders content, so load the deferred payloads in one go
+    article = await db.get(
+        Article, article_id, options=[undefer_group("payloads")]
+    )
 
     if not article:
         raise HTTPException(
@@ -100,12 +98,11 @@ async def get_article(
             detail="Article not found"
         )
 
-    # Sanitize output for preview if available
-    output = None
-    if article.output_payload:
-        output = article.output_payload.copy()
-        if "body_html" in output:
-            output["body_html"] = sanitize_html(output["body_html"])
+    # Prefer the payload sanitized at generation time; fall back to one
+    # batched sanitize pass for rows generated before the cache existed
+    output = article.sanitized_payload
+    if output is None and article.output_payload:
+        output = sanitize_output_payload(article.output_payload)
 
     return ArticleResponse(
         article_id=str(article.id),
@@ -129,12 +126,12 @@ async def get_article(
 async def publish_article(
     article_id: UUID,
     publish_data: PublishRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> PublishResponse:
     """Publish article to WordPress"""
     try:
         # Get article
-        article = db.query(Article).filter(Article.id == article_id).first()
+        article = await db.get(Article, article_id)
 
         if not article:
             raise HTTPException(
@@ -154,8 +151,10 @@ async def publish_article(
                 detail="Article has already been published"
             )
 
-        # Start publishing task
-        task_result = task_publish_article.delay(str(article.id), publish_data.dict())
+        # Start publishing task (batched broker publish)
+        await task_dispatcher.enqueue(
+            "publish.article", [str(article.id), publish_data.model_dump(mode="json")]
+        )
 
         logger.info(f"Started WordPress publishing for {article.id}")
 
@@ -186,11 +185,11 @@ async def publish_article(
 )
 async def regenerate_article(
     article_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> GenerateResponse:
     """Regenerate article content"""
     try:
-        article = db.query(Article).filter(Article.id == article_id).first()
+        article = await db.get(Article, article_id)
 
         if not article:
             raise HTTPException(
@@ -201,14 +200,18 @@ async def regenerate_article(
         # Reset article status and clear output
         article.status = ArticleStatus.PENDING
         article.output_payload = None
+        article.sanitized_payload = None
         article.char_count = 0
         article.wp_post_id = None
         article.wp_url = None
 
-        db.commit()
+        await db.commit()
+
+        # Drop any cached preview render of the stale output
+        await FastAPICache.clear(namespace="preview")
 
-        # Start generation task
-        task_generate_article.delay(str(article.id))
+        # Start generation task (batched broker publish)
+        await task_dispatcher.enqueue("generate.article", [str(article.id)])
 
         logger.info(f"Started article regeneration for {article.id}")
 
@@ -222,7 +225,7 @@ async def regenerate_article(
         raise
     except Exception as e:
         logger.error(f"Failed to start article regeneration for {article_id}: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to start article regeneration"
@@ -237,11 +240,11 @@ async def regenerate_article(
 )
 async def delete_article(
     article_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> None:
     """Delete article"""
     try:
-        article = db.query(Article).filter(Article.id == article_id).first()
+        article = await db.get(Article, article_id)
 
         if not article:
             raise HTTPException(
@@ -251,8 +254,10 @@ async def delete_article(
 
         # TODO: Cancel any running tasks for this article
 
-        db.delete(article)
-        db.commit()
+        await db.delete(article)
+        await db.commit()
+
+        await FastAPICache.clear(namespace="preview")
 
         logger.info(f"Deleted article {article_id}")
 
@@ -260,7 +265,7 @@ async def delete_article(
         raise
     except Exception as e:
         logger.error(f"Failed to delete article {article_id}: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete article"
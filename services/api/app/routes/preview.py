@@ -5,14 +5,17 @@ import logging
 from uuid import UUID
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+from fastapi_cache.decorator import cache
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
-from app.deps import get_db
-from app.models import Article
-from app.services.sanitizer import sanitize_html
+from app.deps import get_async_sessionmaker, get_db
+from app.models import Article, ArticleStatus
+from app.services.sanitizer import sanitize_output_payload
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -21,29 +24,20 @@ logger = logging.getLogger(__name__)
 templates = Jinja2Templates(directory="app/templates")
 
 
-@router.get(
-    "/{article_id}",
-    response_class=HTMLResponse,
-    summary="Preview article",
-    description="Display article preview with HTML template"
-)
-async def preview_article(
-    request: Request,
-    article_id: UUID,
-    db: Session = Depends(get_db)
-) -> HTMLResponse:
-    """Display article preview in HTML format"""
-    try:
-        # Get article
-        article = db.query(Article).filter(Article.id == article_id).first()
+async def _load_preview_data(article_id: str) -> Optional[dict]:
+    """Load and prepare template data for one article
+
+    Opens its own short-lived session. Returns None when the article does
+    not exist.
+    """
+    async with get_async_sessionmaker()() as db:
+        article = await db.get(
+            Article, UUID(article_id), options=[undefer_group("payloads")]
+        )
 
         if not article:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Article not found"
-            )
+            return None
 
-        # Prepare article data for template
         article_data = {
             "article_id": str(article.id),
             "status": article.status.value,
@@ -55,32 +49,84 @@ async def preview_article(
             "output": None
         }
 
-        # Sanitize and prepare output if available
-        if article.output_payload:
-            output = article.output_payload.copy()
+        # Use the payload sanitized at generation time when present;
+        # sanitize on the fly (one batched pass) only for rows that
+        # predate the cached column
+        if article.sanitized_payload is not None:
+            article_data["output"] = article.sanitized_payload
+        elif article.output_payload:
+            article_data["output"] = sanitize_output_payload(article.output_payload)
 
-            # Sanitize HTML content for safe display
-            if "body_html" in output:
-                output["body_html"] = sanitize_html(output["body_html"])
+    return article_data
 
-            # Sanitize FAQ answers
-            if "faq" in output:
-                for faq_item in output["faq"]:
-                    if "answer_html" in faq_item:
-                        faq_item["answer_html"] = sanitize_html(faq_item["answer_html"])
 
-            # Sanitize CTA HTML
-            if "cta_html" in output:
-                output["cta_html"] = sanitize_html(output["cta_html"])
+# Statuses whose output exists and whose page no longer changes within
+# that status; only these renders are worth caching
+_CACHEABLE_STATUSES = frozenset((
+    ArticleStatus.GENERATED, ArticleStatus.PUBLISHING, ArticleStatus.PUBLISHED
+))
 
-            article_data["output"] = output
 
-        logger.info(f"Rendering preview for article {article_id}")
+async def _article_status(article_id: str):
+    """Status-only lookup (no deferred payloads) to pick the cache path"""
+    async with get_async_sessionmaker()() as db:
+        return (await db.execute(
+            select(Article.status).where(Article.id == UUID(article_id))
+        )).scalar_one_or_none()
 
-        return templates.TemplateResponse(
-            "preview.html",
-            {"request": request, "article": article_data}
-        )
+
+@cache(expire=300, namespace="preview")
+async def _render_preview(article_id: str, status_value: str) -> Optional[str]:
+    """Render preview HTML for one article (Redis-cached 5 min)
+
+    Caching the finished HTML means repeat views skip the DB query, the
+    sanitize fallback and the Jinja render entirely. Only called for
+    completed articles; status_value is part of the cache key so the
+    page re-renders when the worker advances the article (generated ->
+    publishing -> published) instead of serving the old snapshot for
+    the rest of the TTL.
+    """
+    article_data = await _load_preview_data(article_id)
+    if article_data is None:
+        return None
+    return templates.get_template("preview.html").render({"article": article_data})
+
+
+@router.get(
+    "/{article_id}",
+    response_class=HTMLResponse,
+    summary="Preview article",
+    description="Display article preview with HTML template"
+)
+async def preview_article(article_id: UUID) -> HTMLResponse:
+    """Display article preview in HTML format"""
+    try:
+        current_status = await _article_status(str(article_id))
+        if current_status is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Article not found"
+            )
+
+        if current_status in _CACHEABLE_STATUSES:
+            html = await _render_preview(str(article_id), current_status.value)
+        else:
+            # Still generating (or failed): render uncached so a polling
+            # client sees the finished page as soon as the worker lands it
+            article_data = await _load_preview_data(str(article_id))
+            html = (
+                templates.get_template("preview.html").render({"article": article_data})
+                if article_data is not None
+                else None
+            )
+
+        if html is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Article not found"
+            )
+
+        return HTMLResponse(content=html)
 
     except HTTPException:
         raise
@@ -99,11 +145,13 @@ async def preview_article(
 )
 async def get_raw_article(
     article_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> dict:
     """Get raw article data for debugging"""
     try:
-        article = db.query(Article).filter(Article.id == article_id).first()
+        article = await db.get(
+            Article, article_id, options=[undefer_group("payloads")]
+        )
 
         if not article:
             raise HTTPException(
@@ -115,14 +163,15 @@ async def get_raw_article(
             "id": str(article.id),
             "status": article.status.value,
             "char_count": article.char_count,
-            "created_at": article.created_at.isoformat(),
-            "updated_at": article.updated_at.isoformat(),
+            # ORJSONResponse renders datetime natively (RFC 3339)
+            "created_at": article.created_at,
+            "updated_at": article.updated_at,
             "wp_post_id": article.wp_post_id,
             "wp_url": article.wp_url,
             "input_payload": article.input_payload,
             "output_payload": article.output_payload,
             "slug": article.slug,
-            "idempotency_key": article.idempotency_key
+            "idempotency_key": article.idempotency_key.hex() if article.idempotency_key else None
         }
 
     except HTTPException:
@@ -1,16 +1,24 @@
 """
 WordPress taxonomy management API routes
 """
+import asyncio
 import logging
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-
-from app.deps import get_db
+from fastapi_cache import FastAPICache
+from fastapi_cache.coder import PickleCoder
+from fastapi_cache.decorator import cache
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.deps import get_async_sessionmaker, get_db
 from app.models import Taxonomy, TaxonomyType
-from app.schemas import TaxonomyResponse, TaxonomyItem, ErrorResponse
+from app.schemas import (
+    CreateTaxonomyItem, TaxonomyResponse, TaxonomyItem, ErrorResponse
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -18,12 +26,13 @@ logger = logging.getLogger(__name__)
 
 @router.get(
     "/sync",
-    response_model=TaxonomyResponse,
+    # response_model=None: rows are trusted, skip response re-validation
+    response_model=None,
     summary="Sync WordPress taxonomies",
     description="Fetch and cache WordPress categories and tags"
 )
 async def sync_taxonomies(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> TaxonomyResponse:
     """Sync WordPress categories and tags with local cache"""
     try:
@@ -31,16 +40,13 @@ async def sync_taxonomies(
 
         logger.info("Starting taxonomy sync with WordPress")
 
-        # Use actual WordPress API via taxonomy service
-        categories_synced, tags_synced = await taxonomy_service.sync_taxonomies_from_wordpress()
-
-        # Get the synced data for response
-        wp_categories = await taxonomy_service.get_cached_categories()
-        wp_tags = await taxonomy_service.get_cached_tags()
+        # Sync returns the fetched rows, so no follow-up cache query needed
+        wp_categories, wp_tags = await taxonomy_service.sync_taxonomies_from_wordpress()
 
-        # Convert to response format
+        # Convert to response format; model_construct skips validation on
+        # data WordPress already returned well-formed
         categories = [
-            TaxonomyItem(
+            TaxonomyItem.model_construct(
                 id=cat["id"],
                 name=cat["name"],
                 slug=cat["slug"],
@@ -50,7 +56,7 @@ async def sync_taxonomies(
         ]
 
         tags = [
-            TaxonomyItem(
+            TaxonomyItem.model_construct(
                 id=tag["id"],
                 name=tag["name"],
                 slug=tag["slug"],
@@ -59,9 +65,12 @@ async def sync_taxonomies(
             for tag in wp_tags
         ]
 
-        logger.info(f"Taxonomy sync completed: {categories_synced} categories, {tags_synced} tags")
+        logger.info(f"Taxonomy sync completed: {len(categories)} categories, {len(tags)} tags")
 
-        return TaxonomyResponse(
+        # Cached category/tag listings are stale after a sync
+        await FastAPICache.clear(namespace="tax")
+
+        return TaxonomyResponse.model_construct(
             categories=categories,
             tags=tags,
             synced_at=datetime.now()
@@ -77,21 +86,28 @@ async def sync_taxonomies(
 
 @router.get(
     "/categories",
-    response_model=List[TaxonomyItem],
+    response_model=None,
     summary="Get cached categories",
     description="Retrieve cached WordPress categories"
 )
-async def get_categories(
-    db: Session = Depends(get_db)
-) -> List[TaxonomyItem]:
-    """Get cached categories"""
+@cache(expire=3600, namespace="tax", coder=PickleCoder)
+async def get_categories() -> List[TaxonomyItem]:
+    """Get cached categories
+
+    The session is opened in the body rather than via Depends: the cache
+    key is built from the handler's kwargs, and a per-request session
+    object would make every key unique (no hits, just Redis writes).
+    """
     try:
-        categories = db.query(Taxonomy).filter(
-            Taxonomy.type == TaxonomyType.CATEGORY
-        ).order_by(Taxonomy.name).all()
+        async with get_async_sessionmaker()() as db:
+            categories = (await db.execute(
+                select(Taxonomy)
+                .where(Taxonomy.type == TaxonomyType.CATEGORY)
+                .order_by(Taxonomy.name)
+            )).scalars().all()
 
         return [
-            TaxonomyItem(
+            TaxonomyItem.model_construct(
                 id=cat.wp_id or 0,
                 name=cat.name,
                 slug=cat.slug,
@@ -110,21 +126,27 @@ async def get_categories(
 
 @router.get(
     "/tags",
-    response_model=List[TaxonomyItem],
+    response_model=None,
     summary="Get cached tags",
     description="Retrieve cached WordPress tags"
 )
-async def get_tags(
-    db: Session = Depends(get_db)
-) -> List[TaxonomyItem]:
-    """Get cached tags"""
+@cache(expire=3600, namespace="tax", coder=PickleCoder)
+async def get_tags() -> List[TaxonomyItem]:
+    """Get cached tags
+
+    Session opened in the body for a stable cache key; see
+    get_categories.
+    """
     try:
-        tags = db.query(Taxonomy).filter(
-            Taxonomy.type == TaxonomyType.TAG
-        ).order_by(Taxonomy.name).all()
+        async with get_async_sessionmaker()() as db:
+            tags = (await db.execute(
+                select(Taxonomy)
+                .where(Taxonomy.type == TaxonomyType.TAG)
+                .order_by(Taxonomy.name)
+            )).scalars().all()
 
         return [
-            TaxonomyItem(
+            TaxonomyItem.model_construct(
                 id=tag.wp_id or 0,
                 name=tag.name,
                 slug=tag.slug,
@@ -152,7 +174,7 @@ async def create_category(
     name: str,
     slug: str = None,
     description: str = "",
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> TaxonomyItem:
     """Create new category in WordPress"""
     try:
@@ -162,10 +184,12 @@ async def create_category(
         logger.info(f"Creating category: {name}")
 
         # Check if category already exists
-        existing = db.query(Taxonomy).filter(
-            Taxonomy.type == TaxonomyType.CATEGORY,
-            Taxonomy.name == name
-        ).first()
+        existing = (await db.execute(
+            select(Taxonomy).where(
+                Taxonomy.type == TaxonomyType.CATEGORY,
+                Taxonomy.name == name
+            )
+        )).scalar_one_or_none()
 
         if existing:
             raise HTTPException(
@@ -184,8 +208,10 @@ async def create_category(
         # Create local cache entry
         taxonomy = Taxonomy.create_from_wp(TaxonomyType.CATEGORY, wp_response)
         db.add(taxonomy)
-        db.commit()
-        db.refresh(taxonomy)
+        await db.commit()
+        await db.refresh(taxonomy)
+
+        await FastAPICache.clear(namespace="tax")
 
         logger.info(f"Created category {name} with ID {wp_response['id']}")
 
@@ -200,7 +226,7 @@ async def create_category(
         raise
     except Exception as e:
         logger.error(f"Failed to create category {name}: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create category"
@@ -218,7 +244,7 @@ async def create_tag(
     name: str,
     slug: str = None,
     description: str = "",
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> TaxonomyItem:
     """Create new tag in WordPress"""
     try:
@@ -228,10 +254,12 @@ async def create_tag(
         logger.info(f"Creating tag: {name}")
 
         # Check if tag already exists
-        existing = db.query(Taxonomy).filter(
-            Taxonomy.type == TaxonomyType.TAG,
-            Taxonomy.name == name
-        ).first()
+        existing = (await db.execute(
+            select(Taxonomy).where(
+                Taxonomy.type == TaxonomyType.TAG,
+                Taxonomy.name == name
+            )
+        )).scalar_one_or_none()
 
         if existing:
             raise HTTPException(
@@ -250,11 +278,12 @@ async def create_tag(
         # Create local cache entry
         taxonomy = Taxonomy.create_from_wp(TaxonomyType.TAG, wp_response)
         db.add(taxonomy)
-        db.commit()
-        db.refresh(taxonomy)
+        await db.commit()
+        await db.refresh(taxonomy)
 
-        logger.info(f"Created tag {name} with ID {wp_response['id']}")
+        await FastAPICache.clear(namespace="tax")
 
+        logger.info(f"Created tag {name} with ID {wp_response['id']}")
         return TaxonomyItem(
             id=wp_response["id"],
             name=wp_response["name"],
@@ -266,8 +295,132 @@ async def create_tag(
         raise
     except Exception as e:
         logger.error(f"Failed to create tag {name}: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create tag"
+        )
+
+
+async def _bulk_create_taxonomies(
+    type_: TaxonomyType,
+    items: List[CreateTaxonomyItem],
+    db: AsyncSession
+) -> Dict[str, Any]:
+    """Create many taxonomies: one existence check, concurrent WordPress
+    calls bounded by a semaphore, one bulk insert into the local cache."""
+    from app.clients.wp_client import get_wordpress_client
+
+    # Dedupe by name, keeping first occurrence
+    items = list({item.name: item for item in items}.values())
+
+    existing = set((await db.execute(
+        select(Taxonomy.name).where(
+            Taxonomy.type == type_,
+            Taxonomy.name.in_([item.name for item in items])
+        )
+    )).scalars().all())
+    missing = [item for item in items if item.name not in existing]
+
+    wordpress_client = get_wordpress_client()
+    create = (
+        wordpress_client.create_category
+        if type_ == TaxonomyType.CATEGORY
+        else wordpress_client.create_tag
+    )
+    semaphore = asyncio.Semaphore(10)
+
+    async def _create(item: CreateTaxonomyItem) -> Dict[str, Any]:
+        async with semaphore:
+            return await create(
+                name=item.name,
+                slug=item.slug,
+                description=item.description
+            )
+
+    results = await asyncio.gather(
+        *(_create(item) for item in missing), return_exceptions=True
+    )
+
+    created = []
+    failed = []
+    rows = []
+    for item, result in zip(missing, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to create {type_.value} '{item.name}': {str(result)}")
+            failed.append(item.name)
+            continue
+        rows.append({
+            "type": type_,
+            "name": result["name"],
+            "slug": result["slug"],
+            "wp_id": result["id"],
+            "description": result.get("description", ""),
+        })
+        created.append(TaxonomyItem.model_construct(
+            id=result["id"],
+            name=result["name"],
+            slug=result["slug"],
+            description=result.get("description", "")
+        ))
+
+    if rows:
+        await db.execute(
+            pg_insert(Taxonomy)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[Taxonomy.wp_id])
+        )
+        await db.commit()
+        await FastAPICache.clear(namespace="tax")
+
+    return {
+        "created": created,
+        "skipped": sorted(existing),
+        "failed": failed,
+    }
+
+
+@router.post(
+    "/categories/bulk",
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create categories in bulk",
+    description="Create many WordPress categories with batched DB and API calls"
+)
+async def create_categories_bulk(
+    items: List[CreateTaxonomyItem],
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """Create many categories at once"""
+    try:
+        return await _bulk_create_taxonomies(TaxonomyType.CATEGORY, items, db)
+    except Exception as e:
+        logger.error(f"Bulk category creation failed: {str(e)}")
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create categories"
+        )
+
+
+@router.post(
+    "/tags/bulk",
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create tags in bulk",
+    description="Create many WordPress tags with batched DB and API calls"
+)
+async def create_tags_bulk(
+    items: List[CreateTaxonomyItem],
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """Create many tags at once"""
+    try:
+        return await _bulk_create_taxonomies(TaxonomyType.TAG, items, db)
+    except Exception as e:
+        logger.error(f"Bulk tag creation failed: {str(e)}")
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create tags"
         )
\ No newline at end of file
@@ -1,12 +1,21 @@
 """
 Pydantic schemas for request/response validation
 """
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Annotated, List, Optional, Dict, Any, Tuple
 from enum import Enum
 
-from pydantic import BaseModel, HttpUrl, Field, validator
-from pydantic.types import constr
+from pydantic import (
+    BaseModel, ConfigDict, Field, HttpUrl, StringConstraints,
+    ValidationInfo, field_validator
+)
+
+
+def _utcnow() -> datetime:
+    """Timestamp factory: time.time() skips datetime.now()'s tz consult"""
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc)
 
 
 class ToneType(str, Enum):
@@ -42,60 +51,35 @@ class GenerateInput(BaseModel):
     summary: str = Field(..., min_length=50, max_length=1000, description="Article summary (50-1000 chars)")
     goal: str = Field(..., min_length=20, max_length=500, description="Article goal/purpose")
     audience: str = Field(..., min_length=10, max_length=200, description="Target audience")
-    must_topics: List[str] = Field(default=[], description="Must-include topics")
-    bans: List[str] = Field(default=[], description="Prohibited topics/words")
-    references: List[HttpUrl] = Field(default=[], max_items=5, description="Reference URLs (max 5)")
+    must_topics: List[str] = Field(default_factory=list, max_length=10, description="Must-include topics (max 10)")
+    bans: List[str] = Field(default_factory=list, max_length=20, description="Prohibited topics/words (max 20)")
+    references: List[HttpUrl] = Field(default_factory=list, max_length=5, description="Reference URLs (max 5)")
     tone: ToneType = Field(default=ToneType.TECH, description="Article tone")
     target_chars: int = Field(default=10000, ge=9000, le=11000, description="Target character count")
     author: Optional[str] = Field(None, max_length=100, description="Author name")
-    internal_links: List[InternalLink] = Field(default=[], max_items=10, description="Internal link candidates")
-
-    @validator('must_topics')
-    def validate_must_topics(cls, v):
-        """Validate must topics"""
-        if len(v) > 10:
-            raise ValueError("Maximum 10 must topics allowed")
-        return v
+    internal_links: List[InternalLink] = Field(default_factory=list, max_length=10, description="Internal link candidates")
 
-    @validator('bans')
-    def validate_bans(cls, v):
-        """Validate banned topics"""
-        if len(v) > 20:
-            raise ValueError("Maximum 20 banned items allowed")
-        return v
+    model_config = ConfigDict(ignored_types=(cached_property,))
 
+    @cached_property
+    def search_domains(self) -> Tuple[str, ...]:
+        """Deduplicated reference hosts, computed once per input (max 20)"""
+        return tuple(dict.fromkeys(url.host for url in self.references))[:20]
 
 class ArticleOutput(BaseModel):
     """Article output schema"""
     title: str = Field(..., min_length=10, max_length=100)
-    slug: constr(regex=r'^[a-z0-9-]+$', min_length=3, max_length=50)
+    slug: Annotated[str, StringConstraints(pattern=r'^[a-z0-9-]+$', min_length=3, max_length=50)]
     excerpt: str = Field(..., min_length=50, max_length=300)
     meta_description: str = Field(..., min_length=50, max_length=160)
-    tags: List[str] = Field(default=[], max_items=10)
-    categories: List[str] = Field(default=[], max_items=5)
+    tags: List[Annotated[str, StringConstraints(min_length=2, max_length=30)]] = Field(default_factory=list, max_length=10)
+    categories: List[Annotated[str, StringConstraints(min_length=2, max_length=50)]] = Field(default_factory=list, max_length=5)
     hero_image_prompt: Optional[str] = Field(None, max_length=500)
     body_html: str = Field(..., min_length=1000)
-    faq: List[FAQ] = Field(default=[], max_items=10)
-    internal_links: List[InternalLink] = Field(default=[], max_items=15)
+    faq: List[FAQ] = Field(default_factory=list, max_length=10)
+    internal_links: List[InternalLink] = Field(default_factory=list, max_length=15)
     cta_html: str = Field(default="")
-    schema_org: Dict[str, Any] = Field(default={})
-
-    @validator('tags')
-    def validate_tags(cls, v):
-        """Validate tags"""
-        for tag in v:
-            if len(tag) < 2 or len(tag) > 30:
-                raise ValueError("Tag length must be between 2-30 characters")
-        return v
-
-    @validator('categories')
-    def validate_categories(cls, v):
-        """Validate categories"""
-        for category in v:
-            if len(category) < 2 or len(category) > 50:
-                raise ValueError("Category length must be between 2-50 characters")
-        return v
-
+    schema_org: Dict[str, Any] = Field(default_factory=dict)
 
 class GenerateResponse(BaseModel):
     """Article generation response"""
@@ -121,12 +105,14 @@ class PublishRequest(BaseModel):
     mode: PublishMode
     schedule_at: Optional[datetime] = Field(None, description="Schedule datetime for future posts")
 
-    @validator('schedule_at')
-    def validate_schedule_at(cls, v, values):
+    @field_validator('schedule_at')
+    @classmethod
+    def validate_schedule_at(cls, v: Optional[datetime], info: ValidationInfo) -> Optional[datetime]:
         """Validate schedule datetime"""
-        if values.get('mode') == PublishMode.SCHEDULE and not v:
+        if info.data.get('mode') == PublishMode.SCHEDULE and not v:
             raise ValueError("schedule_at is required for scheduled posts")
-        if v and v <= datetime.now():
+        # Epoch comparison avoids building a datetime per validation
+        if v and v.timestamp() <= time.time():
             raise ValueError("schedule_at must be in the future")
         return v
 
@@ -139,6 +125,13 @@ class PublishResponse(BaseModel):
     message: Optional[str] = None
 
 
+class CreateTaxonomyItem(BaseModel):
+    """Taxonomy creation request item (bulk endpoints)"""
+    name: str = Field(..., min_length=1, max_length=255)
+    slug: Optional[str] = Field(None, max_length=255)
+    description: str = Field(default="")
+
+
 class TaxonomyItem(BaseModel):
     """Taxonomy item schema"""
     id: int
@@ -158,11 +151,11 @@ class ErrorResponse(BaseModel):
     """Error response schema"""
     detail: str
     error_code: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
     service: str
-    timestamp: datetime = Field(default_factory=datetime.now)
\ No newline at end of file
+    timestamp: datetime = Field(default_factory=_utcnow)
@@ -0,0 +1,192 @@
+"""
+Micro-batched article creation for the /generate endpoint
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.deps import get_async_sessionmaker
+from app.models import Article, ArticleStatus
+
+logger = logging.getLogger(__name__)
+
+# Built once at import so the single-key lookup (the common case outside
+# bursts) reuses one compiled statement from the engine's SQL cache.
+_SELECT_BY_KEY = (
+    select(Article.id, Article.status, Article.idempotency_key)
+    .where(Article.idempotency_key == bindparam("k"))
+)
+
+
+class _PendingRequest:
+    """One caller waiting for its article row"""
+
+    __slots__ = ("idempotency_key", "input_payload", "future")
+
+    def __init__(self, idempotency_key: bytes, input_payload: Dict[str, Any]):
+        self.idempotency_key = idempotency_key
+        self.input_payload = input_payload
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class GenerateBatcher:
+    """Coalesces concurrent /generate requests into one DB round-trip
+
+    Requests arriving within a few-millisecond window are flushed together:
+    a single multi-row INSERT .. ON CONFLICT DO NOTHING RETURNING creates
+    all new articles, and one IN query resolves the keys that already
+    existed. Each caller awaits its future for
+    (article_id, status, created).
+    """
+
+    def __init__(self, max_batch: int = 64, max_wait_ms: float = 3.0):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the background flush coroutine (call from lifespan startup)"""
+        if self._drain_task is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._drain_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush coroutine, failing any still-pending callers"""
+        if self._drain_task is None:
+            return
+        self._drain_task.cancel()
+        try:
+            await self._drain_task
+        except asyncio.CancelledError:
+            pass
+        self._drain_task = None
+        while self._queue is not None and not self._queue.empty():
+            pending = self._queue.get_nowait()
+            if not pending.future.done():
+                pending.future.set_exception(RuntimeError("batcher stopped"))
+        self._queue = None
+
+    async def submit(
+        self,
+        idempotency_key: bytes,
+        input_payload: Dict[str, Any]
+    ) -> Tuple[UUID, str, bool]:
+        """
+        Create-or-fetch an article, coalesced with concurrent callers
+
+        Args:
+            idempotency_key: Raw digest identifying the input
+            input_payload: Serialized GenerateInput
+
+        Returns:
+            Tuple of (article_id, status value, created flag)
+        """
+        if self._queue is None:
+            # Batcher not running (scripts/tests): flush a singleton batch
+            pending = _PendingRequest(idempotency_key, input_payload)
+            await self._flush([pending])
+            return pending.future.result()
+
+        pending = _PendingRequest(idempotency_key, input_payload)
+        await self._queue.put(pending)
+        return await pending.future
+
+    async def _run(self) -> None:
+        """Collect a batch within the wait window, then flush it"""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                logger.error("Batched article create failed: %s", str(e))
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
+
+    async def _flush(self, batch: List[_PendingRequest]) -> None:
+        """Resolve one batch with a single INSERT and at most one SELECT"""
+        # Dedupe identical keys inside the batch; the first caller is the
+        # creator, the rest resolve to the same row.
+        by_key: Dict[bytes, List[_PendingRequest]] = {}
+        for pending in batch:
+            by_key.setdefault(pending.idempotency_key, []).append(pending)
+
+        async with get_async_sessionmaker()() as db:
+            stmt = (
+                pg_insert(Article)
+                .values([
+                    {
+                        "input_payload": waiters[0].input_payload,
+                        "idempotency_key": key,
+                        "status": ArticleStatus.PENDING,
+                    }
+                    for key, waiters in by_key.items()
+                ])
+                .on_conflict_do_nothing(
+                    index_elements=[Article.idempotency_key],
+                    index_where=Article.idempotency_key.isnot(None),
+                )
+                .returning(Article.id, Article.idempotency_key)
+            )
+            inserted = {row.idempotency_key: row.id for row in await db.execute(stmt)}
+            await db.commit()
+
+            existing: Dict[bytes, Tuple[UUID, str]] = {}
+            missing = [key for key in by_key if key not in inserted]
+            if len(missing) == 1:
+                rows = await db.execute(_SELECT_BY_KEY, {"k": missing[0]})
+            elif missing:
+                rows = await db.execute(
+                    select(Article.id, Article.status, Article.idempotency_key)
+                    .where(Article.idempotency_key.in_(missing))
+                )
+            else:
+                rows = []
+            for row in rows:
+                existing[row.idempotency_key] = (row.id, row.status.value)
+
+        for key, waiters in by_key.items():
+            if key in inserted:
+                results = [(inserted[key], ArticleStatus.PENDING.value, True)]
+                results += [
+                    (inserted[key], ArticleStatus.PENDING.value, False)
+                ] * (len(waiters) - 1)
+            elif key in existing:
+                article_id, status_value = existing[key]
+                results = [(article_id, status_value, False)] * len(waiters)
+            else:
+                # Should not happen: neither inserted nor found
+                error = RuntimeError("article row missing after batched insert")
+                for pending in waiters:
+                    if not pending.future.done():
+                        pending.future.set_exception(error)
+                continue
+
+            for pending, result in zip(waiters, results):
+                if not pending.future.done():
+                    pending.future.set_result(result)
+
+
+# Create batcher instance (started from the FastAPI lifespan)
+generate_batcher = GenerateBatcher()
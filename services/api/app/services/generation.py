@@ -3,7 +3,9 @@ Article generation service with character count control
 """
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 from app.schemas import GenerateInput, ArticleOutput
 from app.clients.pplx_client import perplexity_client
@@ -15,6 +17,71 @@ from app.utils.logging import log_article_generation
 
 logger = logging.getLogger(__name__)
 
+# Patterns for the merge/condense hot paths, compiled once at import
+_EMPTY_P_RE = re.compile(r'<p>\s*</p>')
+_SHORT_P_RE = re.compile(r'<p>([^<]{1,20})</p>')
+_TAG_RE = re.compile(r'<[^>]+>')
+# Merge cleanup fused into one alternation so the merged article is
+# scanned once instead of once per pattern; lookaheads keep the trailing
+# tag unconsumed so empty-paragraph removal still sees it
+_MERGE_CLEAN_RE = re.compile(
+    r'(</h[23]>\n*(?=<p>))'
+    r'|(</h[23]>\n*(?=<h[23]>))'
+    r'|(<p>\s*</p>)'
+    r'|(\n{3,})'
+)
+_MERGE_CLEAN_REPL = {1: '</h2>\n', 2: '</h2>\n', 3: '', 4: '\n\n'}
+
+
+def _merge_clean_dispatch(match: "re.Match[str]") -> str:
+    """Replacement chooser for _MERGE_CLEAN_RE"""
+    return _MERGE_CLEAN_REPL[match.lastindex]
+_NEXT_H2_RE = re.compile(r'<h2[^>]*>', re.IGNORECASE)
+_LI_RE = re.compile(r'<li[^>]*>(.*?)</li>', re.DOTALL)
+_LIST_BLOCK_RE = re.compile(r'<(ul|ol)([^>]*)>(.*?)</\1>', re.DOTALL)
+_EXAMPLE_P_RE = re.compile(r'<p>例えば[^<]+</p>')
+# {201,} makes the regex engine skip short paragraphs, so the Python
+# callback only ever runs for paragraphs that actually get shortened
+_LONG_P_RE = re.compile(r'<p>([^<]{201,})</p>')
+
+
+def _count_text_chars(snippet: str) -> int:
+    """Non-whitespace text chars in a small HTML snippet (tags stripped)
+
+    Only ever runs on removed fragments, so the per-character scan stays
+    tiny — it replaces re-counting the whole document after condensation.
+    """
+    text = _TAG_RE.sub('', snippet)
+    return sum(1 for ch in text if not ch.isspace())
+
+
+@lru_cache(maxsize=64)
+def _h2_title_pattern(h2_title: str) -> "re.Pattern[str]":
+    """Compiled H2 matcher per title (titles repeat across expand passes)"""
+    return re.compile(rf'<h2[^>]*>{re.escape(h2_title)}</h2>', re.IGNORECASE)
+
+
+# Expansion prompt template, formatted per call with format_map
+_EXPANSION_PROMPT_TEMPLATE = """以下のセクションについて、さらに詳細な情報を追加してください。
+
+セクション: {h2_title}
+記事コンテキスト: {summary}
+目標追加文字数: 約{target_chars}文字
+
+追加すべき内容:
+- より具体的な例
+- 詳細な解説
+- 実践的なアドバイス
+- 関連する補足情報
+
+HTML形式（h3, p, ul, ol, li, strong, em タグを使用）で出力してください。"""
+
+
+@lru_cache(maxsize=1)
+def _system_message() -> Dict[str, str]:
+    """System message dict, built once and shared across expansion calls"""
+    return {"role": "system", "content": perplexity_client._build_system_prompt()}
+
 
 class ArticleGenerationService:
     """Service for generating articles with character control"""
@@ -57,27 +124,55 @@ class ArticleGenerationService:
             target_per_section = max(self.min_section_chars,
                                    min(self.max_section_chars, target_per_section))
 
-            # Step 3: Generate sections
+            # Step 3: Generate sections concurrently and sanitize each one
+            # the moment its API response lands. as_completed lets the
+            # CPU-bound sanitize of finished sections (on a worker thread)
+            # overlap with still-in-flight Perplexity calls, instead of
+            # waiting for the slowest section before touching any of them.
             logger.info(f"Generating {len(sections)} sections with ~{target_per_section} chars each")
-            section_contents = []
+            sem = asyncio.Semaphore(perplexity_client.settings.pplx_max_concurrency)
 
-            for i, section in enumerate(sections):
-                logger.info(f"Generating section {i+1}/{len(sections)}: {section.get('h2', 'Unknown')}")
-
-                section_content = await perplexity_client.generate_section(
-                    input_data, section, target_per_section
-                )
+            async def _fetch_section(index: int, section: Dict[str, Any]) -> Tuple[int, str]:
+                async with sem:
+                    return index, await perplexity_client.generate_section(
+                        input_data, section, target_per_section
+                    )
 
-                # Sanitize section content
-                section_content = sanitize_html(section_content)
-                section_contents.append(section_content)
+            tasks = [
+                asyncio.ensure_future(_fetch_section(i, section))
+                for i, section in enumerate(sections)
+            ]
+            def _sanitize_section(raw_html: str) -> str:
+                # Cleanup runs per ~2k-char section here so the merge
+                # step is a plain join with no full-document regex pass
+                return self._clean_merged_content(sanitize_html(raw_html))
 
+            section_contents: List[str] = [""] * len(sections)
+            try:
+                for fut in asyncio.as_completed(tasks):
+                    index, raw = await fut
+                    section_contents[index] = await asyncio.to_thread(
+                        _sanitize_section, raw
+                    ) if raw else ""
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            # Pre-count on the same thread so the log loop below only
+            # hits the memoized counts
+            section_counts = await asyncio.to_thread(
+                lambda: [count_ja_chars_from_html(s) for s in section_contents]
+            )
+            for i, chars in enumerate(section_counts):
                 log_article_generation(article_id, "section_generated", "success",
-                                     section_index=i, chars=count_ja_chars_from_html(section_content))
+                                     section_index=i, chars=chars)
 
             # Step 4: Merge sections
             logger.info("Merging sections")
-            merged_content = self._merge_sections(section_contents)
+            merged_content = await asyncio.to_thread(
+                self._merge_sections, section_contents
+            )
 
             # Step 5: Character count adjustment
             logger.info("Adjusting character count")
@@ -85,16 +180,32 @@ class ArticleGenerationService:
                 input_data, merged_content, sections
             )
 
-            # Step 6: Final validation and sanitization
-            final_content = sanitize_html(adjusted_content)
-            final_char_count = count_ja_chars_from_html(final_content)
-
-            # Step 7: Generate metadata
-            logger.info("Generating article metadata")
-            article_data = await perplexity_client.finalize_article(
-                input_data, outline, section_contents
+            # Step 6: Final validation and sanitization (CPU-bound,
+            # keep it off the loop)
+            final_content = await asyncio.to_thread(sanitize_html, adjusted_content)
+            final_char_count = await asyncio.to_thread(
+                count_ja_chars_from_html, final_content
             )
 
+            # Step 7: Generate metadata. The outline call already asks for
+            # slug/excerpt/meta; when those came back filled we can skip the
+            # extra finalization round-trip entirely.
+            if outline.get("slug") and outline.get("meta_description"):
+                logger.info("Reusing outline-provided metadata, skipping finalize call")
+                article_data = {
+                    "title": outline.get("title", ""),
+                    "slug": outline["slug"],
+                    "excerpt": outline.get("excerpt", ""),
+                    "meta_description": outline["meta_description"],
+                    "tags": outline.get("tags", []),
+                    "categories": outline.get("categories", []),
+                }
+            else:
+                logger.info("Generating article metadata")
+                article_data = await perplexity_client.finalize_article(
+                    input_data, outline, section_contents
+                )
+
             # Set the final content
             article_data["body_html"] = final_content
 
@@ -135,10 +246,14 @@ class ArticleGenerationService:
         Returns:
             Adjusted content
         """
-        current_chars = count_ja_chars_from_html(content)
         target_chars = input_data.target_chars
 
-        validation = validate_article_length(content, target_chars)
+        # validate_article_length owns the (possibly skipped) count; run
+        # it off the loop since the slow path parses the document
+        validation = await asyncio.to_thread(
+            validate_article_length, content, target_chars
+        )
+        current_chars = validation["char_count"]
 
         if validation["is_valid"]:
             logger.info(f"Character count is valid: {current_chars}/{target_chars}")
@@ -185,28 +300,34 @@ class ArticleGenerationService:
         sections_to_expand = min(3, len(sections))
         chars_per_expansion = chars_needed // sections_to_expand
 
-        # For each selected section, generate additional content
-        expanded_content = content
-
-        for i in range(min(sections_to_expand, len(sections))):
-            section = sections[i]
-
-            try:
-                additional_content = await self._generate_section_expansion(
+        # Generate all expansions concurrently (independent API calls),
+        # then insert sequentially to keep positions deterministic
+        targets = sections[:sections_to_expand]
+        expansions = await asyncio.gather(
+            *(
+                self._generate_section_expansion(
                     input_data, section, chars_per_expansion
                 )
+                for section in targets
+            ),
+            return_exceptions=True,
+        )
 
-                # Insert additional content after the section's last H3
-                h2_title = section.get("h2", "")
-                if h2_title:
-                    expanded_content = self._insert_content_after_section(
-                        expanded_content, h2_title, additional_content
-                    )
-
-            except Exception as e:
-                logger.warning(f"Failed to expand section {i}: {str(e)}")
+        expanded_content = content
+        for i, (section, additional_content) in enumerate(zip(targets, expansions)):
+            if isinstance(additional_content, Exception):
+                logger.warning(f"Failed to expand section {i}: {str(additional_content)}")
+                continue
+            if not additional_content:
                 continue
 
+            # Insert additional content after the section's last H3
+            h2_title = section.get("h2", "")
+            if h2_title:
+                expanded_content = self._insert_content_after_section(
+                    expanded_content, h2_title, additional_content
+                )
+
         return expanded_content
 
     async def _condense_content(self, content: str, chars_to_remove: int) -> str:
@@ -228,21 +349,30 @@ class ArticleGenerationService:
         # 3. Remove excessive examples
 
         condensed = content
+        removed_chars = 0
 
-        # Remove empty paragraphs
-        import re
-        condensed = re.sub(r'<p>\s*</p>', '', condensed)
+        # Remove empty paragraphs (whitespace only, no countable text)
+        condensed = _EMPTY_P_RE.sub('', condensed)
 
-        # Remove very short paragraphs (likely redundant)
-        condensed = re.sub(r'<p>[^<]{1,20}</p>', '', condensed)
+        # Remove very short paragraphs (likely redundant), tallying the
+        # dropped text as we go
+        def _drop_short_paragraph(match: "re.Match[str]") -> str:
+            nonlocal removed_chars
+            removed_chars += _count_text_chars(match.group(1))
+            return ''
 
-        # Condense list items if lists are too long
-        condensed = self._condense_long_lists(condensed)
+        condensed = _SHORT_P_RE.sub(_drop_short_paragraph, condensed)
 
-        # If still too long, try more aggressive condensation
-        current_chars = count_ja_chars_from_html(condensed)
-        if current_chars > count_ja_chars_from_html(content) - chars_to_remove:
-            condensed = self._aggressive_condense(condensed, chars_to_remove)
+        # Condense list items if lists are too long
+        condensed, list_removed = self._condense_long_lists(condensed)
+        removed_chars += list_removed
+
+        # The running tally replaces a second full parse-and-count of the
+        # condensed document; the original count is already memoized
+        if removed_chars < chars_to_remove:
+            condensed = self._aggressive_condense(
+                condensed, chars_to_remove - removed_chars
+            )
 
         return condensed
 
@@ -255,24 +385,16 @@ class ArticleGenerationService:
         """Generate additional content for a section"""
         h2_title = section.get("h2", "")
 
-        # Create a focused prompt for expansion
-        expansion_prompt = f"""以下のセクションについて、さらに詳細な情報を追加してください。
-
-セクション: {h2_title}
-記事コンテキスト: {input_data.summary}
-目標追加文字数: 約{target_chars}文字
-
-追加すべき内容:
-- より具体的な例
-- 詳細な解説
-- 実践的なアドバイス
-- 関連する補足情報
-
-HTML形式（h3, p, ul, ol, li, strong, em タグを使用）で出力してください。"""
+        # Create a focused prompt for expansion from the shared template
+        expansion_prompt = _EXPANSION_PROMPT_TEMPLATE.format_map({
+            "h2_title": h2_title,
+            "summary": input_data.summary,
+            "target_chars": target_chars,
+        })
 
         try:
             response = await perplexity_client._call_api([
-                {"role": "system", "content": perplexity_client._build_system_prompt()},
+                _system_message(),
                 {"role": "user", "content": expansion_prompt}
             ], max_tokens=2000)
 
@@ -292,99 +414,88 @@ HTML形式（h3, p, ul, ol, li, strong, em タグを使用）で出力してく
         Returns:
             Merged HTML content
         """
-        # Simple concatenation with cleanup
-        merged = "\n\n".join(section_contents)
-
-        # Clean up duplicate headings or spacing issues
-        merged = self._clean_merged_content(merged)
-
-        return merged
+        # Sections are already normalized at sanitize time, so merging
+        # is one join — no full-document cleanup pass or intermediate
+        # copy of the joined string
+        return "\n\n".join(section_contents)
 
     def _clean_merged_content(self, content: str) -> str:
-        """Clean merged content for consistency"""
-        import re
-
-        # Remove excessive line breaks
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        """Clean merged content for consistency
 
-        # Ensure proper spacing around headings
-        content = re.sub(r'</h[23]>\n*<p>', '</h2>\n<p>', content)
-        content = re.sub(r'</h[23]>\n*<h[23]>', '</h2>\n<h3>', content)
-
-        # Remove empty paragraphs
-        content = re.sub(r'<p>\s*</p>', '', content)
-
-        return content.strip()
+        Heading spacing, empty-paragraph removal and excess line-break
+        collapsing run as one fused scan instead of four re.sub passes.
+        """
+        return _MERGE_CLEAN_RE.sub(_merge_clean_dispatch, content).strip()
 
     def _insert_content_after_section(self, content: str, h2_title: str, additional_content: str) -> str:
         """Insert additional content after a specific H2 section"""
-        import re
-
-        # Find the H2 section
-        h2_pattern = rf'<h2[^>]*>{re.escape(h2_title)}</h2>'
-
-        # Find the next H2 or end of content
-        next_h2_pattern = r'<h2[^>]*>'
-
-        match = re.search(h2_pattern, content, re.IGNORECASE)
+        # Find the H2 section (compiled per title, cached across passes)
+        match = _h2_title_pattern(h2_title).search(content)
         if not match:
             return content
 
         # Find where this section ends (next H2 or end of content)
         start_pos = match.end()
-        next_match = re.search(next_h2_pattern, content[start_pos:], re.IGNORECASE)
+        next_match = _NEXT_H2_RE.search(content, start_pos)
 
         if next_match:
-            insert_pos = start_pos + next_match.start()
-            return (content[:insert_pos] +
-                   f"\n\n{additional_content}\n\n" +
-                   content[insert_pos:])
+            # search() with a pos argument reports absolute offsets
+            insert_pos = next_match.start()
+            # One join, one result allocation — no intermediate copies of
+            # the full article from chained '+'
+            return ''.join((
+                content[:insert_pos], '\n\n', additional_content, '\n\n',
+                content[insert_pos:]
+            ))
         else:
             # Insert at end
-            return content + f"\n\n{additional_content}"
+            return ''.join((content, '\n\n', additional_content))
+
+    def _condense_long_lists(self, content: str) -> Tuple[str, int]:
+        """Condense overly long lists
 
-    def _condense_long_lists(self, content: str) -> str:
-        """Condense overly long lists"""
-        import re
+        Returns:
+            Tuple of (condensed content, approx text chars removed)
+        """
+        removed_chars = 0
 
         # Find lists with more than 7 items and reduce them
         def condense_list(match):
-            list_content = match.group(1)
-            items = re.findall(r'<li[^>]*>(.*?)</li>', list_content, re.DOTALL)
+            nonlocal removed_chars
+            tag, attrs, body = match.group(1), match.group(2), match.group(3)
+            items = _LI_RE.findall(body)
 
             if len(items) > 7:
                 # Keep first 5 items and add "など" (etc.)
                 condensed_items = items[:5]
                 condensed_items.append("など")
+                removed_chars += sum(
+                    _count_text_chars(item) for item in items[5:]
+                )
 
                 new_list = '\n'.join(f'<li>{item}</li>' for item in condensed_items)
-                return f'<{match.group(0).split()[0][1:]}>\n{new_list}\n</{match.group(0).split()[0][1:].split(">")[0]}>'
+                return f'<{tag}{attrs}>\n{new_list}\n</{tag}>'
 
             return match.group(0)
 
-        # Apply to both ul and ol lists
-        content = re.sub(r'<(ul[^>]*)>(.*?)</ul>', condense_list, content, flags=re.DOTALL)
-        content = re.sub(r'<(ol[^>]*)>(.*?)</ol>', condense_list, content, flags=re.DOTALL)
+        # One pass covers both ul and ol lists
+        content = _LIST_BLOCK_RE.sub(condense_list, content)
 
-        return content
+        return content, removed_chars
 
     def _aggressive_condense(self, content: str, chars_to_remove: int) -> str:
         """More aggressive content condensation"""
-        import re
-
         # Remove detailed examples that are too verbose
-        content = re.sub(r'<p>例えば[^<]+</p>', '', content)
+        content = _EXAMPLE_P_RE.sub('', content)
 
-        # Shorten very long paragraphs
+        # Shorten very long paragraphs; the pattern's length bound means
+        # most paragraphs never reach Python at all
         def shorten_paragraph(match):
-            p_content = match.group(1)
-            if len(p_content) > 200:  # Very long paragraph
-                # Keep first 150 characters and add conclusion
-                shortened = p_content[:150] + "。"
-                return f'<p>{shortened}</p>'
-            return match.group(0)
+            # Keep first 150 characters and add conclusion
+            return f'<p>{match.group(1)[:150]}。</p>'
 
-        content = re.sub(r'<p>([^<]+)</p>', shorten_paragraph, content)
+        if '<p>' in content:
+            content = _LONG_P_RE.sub(shorten_paragraph, content)
 
         return content
 
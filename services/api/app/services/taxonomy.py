@@ -1,19 +1,196 @@
 """
 WordPress taxonomy management service
 """
+import hashlib
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, Tuple
+import re
+import unicodedata
+from contextlib import contextmanager
+from threading import Lock
+from time import monotonic
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
 
-from app.clients.wp_client import wordpress_client, WordPressAPIError
+from app.clients.wp_client import get_wordpress_client, WordPressAPIError
 from app.models import Taxonomy, TaxonomyType
 from app.deps import SessionLocal
 
 logger = logging.getLogger(__name__)
 
+# Slug transliteration tables and patterns, built once at import.
+# Single-character hiragana romanization (simplified)
+_HIRAGANA_ROMAJI = {
+    'あ': 'a', 'い': 'i', 'う': 'u', 'え': 'e', 'お': 'o',
+    'か': 'ka', 'き': 'ki', 'く': 'ku', 'け': 'ke', 'こ': 'ko',
+    'が': 'ga', 'ぎ': 'gi', 'ぐ': 'gu', 'げ': 'ge', 'ご': 'go',
+    'さ': 'sa', 'し': 'shi', 'す': 'su', 'せ': 'se', 'そ': 'so',
+    'ざ': 'za', 'じ': 'ji', 'ず': 'zu', 'ぜ': 'ze', 'ぞ': 'zo',
+    'た': 'ta', 'ち': 'chi', 'つ': 'tsu', 'て': 'te', 'と': 'to',
+    'だ': 'da', 'ぢ': 'ji', 'づ': 'zu', 'で': 'de', 'ど': 'do',
+    'な': 'na', 'に': 'ni', 'ぬ': 'nu', 'ね': 'ne', 'の': 'no',
+    'は': 'ha', 'ひ': 'hi', 'ふ': 'fu', 'へ': 'he', 'ほ': 'ho',
+    'ば': 'ba', 'び': 'bi', 'ぶ': 'bu', 'べ': 'be', 'ぼ': 'bo',
+    'ぱ': 'pa', 'ぴ': 'pi', 'ぷ': 'pu', 'ぺ': 'pe', 'ぽ': 'po',
+    'ま': 'ma', 'み': 'mi', 'む': 'mu', 'め': 'me', 'も': 'mo',
+    'や': 'ya', 'ゆ': 'yu', 'よ': 'yo',
+    'ら': 'ra', 'り': 'ri', 'る': 'ru', 'れ': 're', 'ろ': 'ro',
+    'わ': 'wa', 'を': 'wo', 'ん': 'n'
+}
+# One translate() pass replaces ~50 sequential str.replace scans
+_HIRAGANA_TRANS = str.maketrans(_HIRAGANA_ROMAJI)
+
+# Common Japanese words, substituted via one compiled alternation
+_COMMON_WORDS = {
+    'テクノロジー': 'technology',
+    'ビジネス': 'business',
+    'ライフスタイル': 'lifestyle',
+    'デザイン': 'design',
+    'プログラミング': 'programming',
+    'マーケティング': 'marketing',
+    'デベロップメント': 'development'
+}
+_COMMON_WORDS_RE = re.compile('|'.join(map(re.escape, _COMMON_WORDS)))
+
+# A run of anything non-alphanumeric (including existing hyphens)
+# becomes one hyphen, so a single sub replaces the old strip+collapse
+# pair of passes
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Process-local name -> wp_id cache so repeated article generations skip
+# the DB round trip for popular names entirely. Entries expire after
+# _TAX_CACHE_TTL seconds and the whole cache is dropped on sync. Guarded
+# by a lock because Celery workers may share this module across threads.
+_TAX_CACHE: Dict[Tuple["TaxonomyType", str], Tuple[int, float]] = {}
+_TAX_CACHE_LOCK = Lock()
+_TAX_CACHE_TTL = 600.0
+_TAX_CACHE_MAX = 4096
+
+
+def _tax_cache_get(type_: "TaxonomyType", name: str) -> Optional[int]:
+    """Return a cached wp_id, dropping the entry if it has expired"""
+    key = (type_, name)
+    with _TAX_CACHE_LOCK:
+        entry = _TAX_CACHE.get(key)
+        if entry is None:
+            return None
+        wp_id, expires_at = entry
+        if expires_at <= monotonic():
+            del _TAX_CACHE[key]
+            return None
+        return wp_id
+
+
+def _tax_cache_put(type_: "TaxonomyType", name: str, wp_id: int) -> None:
+    """Cache one resolution, resetting the cache if it has grown too big"""
+    with _TAX_CACHE_LOCK:
+        if len(_TAX_CACHE) >= _TAX_CACHE_MAX:
+            _TAX_CACHE.clear()
+        _TAX_CACHE[(type_, name)] = (wp_id, monotonic() + _TAX_CACHE_TTL)
+
+
+def _tax_cache_clear() -> None:
+    """Drop every cached resolution (called after a WordPress sync)"""
+    with _TAX_CACHE_LOCK:
+        _TAX_CACHE.clear()
+
+
+class _LookupCoalescer:
+    """Coalesce concurrent (type, name) lookups into one IN-query
+
+    During a publish burst many tasks resolve largely overlapping
+    category/tag names within milliseconds of each other. Instead of
+    one DB query per caller, pending pairs are parked on per-loop
+    futures for a short window and a single flush query answers all of
+    them. State is keyed by event loop because the API process and the
+    Celery worker loop never share awaitables.
+    """
+
+    _WINDOW = 0.05  # seconds to wait for more callers before flushing
+
+    def __init__(self) -> None:
+        self._pending: Dict[
+            asyncio.AbstractEventLoop,
+            Dict[Tuple[TaxonomyType, str], "asyncio.Future[Optional[int]]"],
+        ] = {}
+        self._scheduled: set = set()
+
+    async def lookup(
+        self, pairs: List[Tuple[TaxonomyType, str]]
+    ) -> Dict[Tuple[TaxonomyType, str], Optional[int]]:
+        """Resolve pairs to wp_ids (None for unknown names) via one batch"""
+        loop = asyncio.get_running_loop()
+        pending = self._pending.setdefault(loop, {})
+        futures = {}
+        for pair in pairs:
+            fut = pending.get(pair)
+            if fut is None:
+                fut = loop.create_future()
+                pending[pair] = fut
+            futures[pair] = fut
+
+        if loop not in self._scheduled:
+            self._scheduled.add(loop)
+            loop.call_later(
+                self._WINDOW, lambda: asyncio.ensure_future(self._flush(loop))
+            )
+
+        results = await asyncio.gather(*futures.values())
+        return dict(zip(futures, results))
+
+    async def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Answer every pending pair with one IN-query off the loop"""
+        self._scheduled.discard(loop)
+        pending = self._pending.pop(loop, {})
+        if not pending:
+            return
+        try:
+            resolved = await asyncio.to_thread(self._query, list(pending))
+        except Exception as e:
+            for fut in pending.values():
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for pair, fut in pending.items():
+            if not fut.done():
+                fut.set_result(resolved.get(pair))
+
+    @staticmethod
+    def _query(
+        pairs: List[Tuple[TaxonomyType, str]]
+    ) -> Dict[Tuple[TaxonomyType, str], int]:
+        with _session_scope() as db:
+            rows = db.query(Taxonomy).filter(
+                tuple_(Taxonomy.type, Taxonomy.name).in_(pairs)
+            ).all()
+        return {(row.type, row.name): row.wp_id for row in rows if row.wp_id}
+
+
+_lookup_coalescer = _LookupCoalescer()
+
+
+@contextmanager
+def _session_scope() -> Iterator[Session]:
+    """Borrow a session only for the enclosed DB work
+
+    WordPress calls in this service can take seconds; holding a pooled
+    connection across those awaits starves the pool, so each DB phase
+    opens and releases its own short-lived session instead.
+    """
+    db = SessionLocal()
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
 
 class TaxonomyService:
     """Service for managing WordPress categories and tags"""
@@ -21,83 +198,70 @@ class TaxonomyService:
     def __init__(self):
         self.auto_create_missing = True  # Configuration option
 
-    async def sync_taxonomies_from_wordpress(self) -> Tuple[int, int]:
+    async def sync_taxonomies_from_wordpress(
+        self
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
         Sync categories and tags from WordPress to local cache
 
+        One bulk INSERT .. ON CONFLICT (wp_id) DO UPDATE per taxonomy type
+        replaces the old per-row SELECT + add/update loop, and the fetched
+        WordPress rows are returned so callers need no follow-up query.
+
         Returns:
-            Tuple of (categories_synced, tags_synced)
+            Tuple of (categories, tags) as fetched from WordPress
         """
-        db = SessionLocal()
         try:
             logger.info("Starting taxonomy sync from WordPress")
 
-            # Fetch from WordPress
-            wp_categories = await wordpress_client.get_categories()
-            wp_tags = await wordpress_client.get_tags()
-
-            categories_synced = 0
-            tags_synced = 0
-
-            # Sync categories
-            for wp_cat in wp_categories:
-                try:
-                    existing = db.query(Taxonomy).filter(
-                        Taxonomy.type == TaxonomyType.CATEGORY,
-                        Taxonomy.wp_id == wp_cat["id"]
-                    ).first()
-
-                    if existing:
-                        # Update existing
-                        existing.name = wp_cat["name"]
-                        existing.slug = wp_cat["slug"]
-                        existing.description = wp_cat.get("description", "")
-                        existing.updated_at = datetime.now()
-                    else:
-                        # Create new
-                        taxonomy = Taxonomy.create_from_wp(TaxonomyType.CATEGORY, wp_cat)
-                        db.add(taxonomy)
-
-                    categories_synced += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to sync category {wp_cat.get('name', 'unknown')}: {str(e)}")
-
-            # Sync tags
-            for wp_tag in wp_tags:
-                try:
-                    existing = db.query(Taxonomy).filter(
-                        Taxonomy.type == TaxonomyType.TAG,
-                        Taxonomy.wp_id == wp_tag["id"]
-                    ).first()
-
-                    if existing:
-                        # Update existing
-                        existing.name = wp_tag["name"]
-                        existing.slug = wp_tag["slug"]
-                        existing.description = wp_tag.get("description", "")
-                        existing.updated_at = datetime.now()
-                    else:
-                        # Create new
-                        taxonomy = Taxonomy.create_from_wp(TaxonomyType.TAG, wp_tag)
-                        db.add(taxonomy)
-
-                    tags_synced += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to sync tag {wp_tag.get('name', 'unknown')}: {str(e)}")
-
-            db.commit()
-
-            logger.info(f"Taxonomy sync completed: {categories_synced} categories, {tags_synced} tags")
-            return categories_synced, tags_synced
+            # Fetch from WordPress with no session held across the await
+            wordpress_client = get_wordpress_client()
+            wp_categories, wp_tags = await asyncio.gather(
+                wordpress_client.get_categories(),
+                wordpress_client.get_tags(),
+            )
+
+            with _session_scope() as db:
+                for type_, items in (
+                    (TaxonomyType.CATEGORY, wp_categories),
+                    (TaxonomyType.TAG, wp_tags),
+                ):
+                    if not items:
+                        continue
+                    stmt = pg_insert(Taxonomy).values([
+                        {
+                            "type": type_,
+                            "name": item["name"],
+                            "slug": item["slug"],
+                            "wp_id": item["id"],
+                            "description": item.get("description", ""),
+                        }
+                        for item in items
+                    ])
+                    db.execute(stmt.on_conflict_do_update(
+                        index_elements=[Taxonomy.wp_id],
+                        set_={
+                            "name": stmt.excluded.name,
+                            "slug": stmt.excluded.slug,
+                            "description": stmt.excluded.description,
+                            "updated_at": func.now(),
+                        },
+                    ))
+
+                db.commit()
+
+            # WordPress IDs may have changed; drop cached resolutions
+            _tax_cache_clear()
+
+            logger.info(
+                f"Taxonomy sync completed: {len(wp_categories)} categories, "
+                f"{len(wp_tags)} tags"
+            )
+            return wp_categories, wp_tags
 
         except Exception as e:
-            db.rollback()
             logger.error(f"Taxonomy sync failed: {str(e)}")
             raise
-        finally:
-            db.close()
 
     async def resolve_category_ids(self, category_names: List[str]) -> List[int]:
         """
@@ -109,54 +273,8 @@ class TaxonomyService:
         Returns:
             List of WordPress category IDs
         """
-        if not category_names:
-            return []
-
-        db = SessionLocal()
-        try:
-            category_ids = []
-
-            for name in category_names:
-                # Look up in local cache first
-                taxonomy = db.query(Taxonomy).filter(
-                    Taxonomy.type == TaxonomyType.CATEGORY,
-                    Taxonomy.name == name
-                ).first()
-
-                if taxonomy and taxonomy.wp_id:
-                    category_ids.append(taxonomy.wp_id)
-                    logger.debug(f"Found cached category '{name}' -> ID {taxonomy.wp_id}")
-                elif self.auto_create_missing:
-                    # Create missing category
-                    try:
-                        wp_category = await self._create_missing_category(name)
-                        category_ids.append(wp_category["id"])
-
-                        # Cache the new category
-                        new_taxonomy = Taxonomy.create_from_wp(TaxonomyType.CATEGORY, wp_category)
-                        db.add(new_taxonomy)
-                        db.commit()
-
-                        logger.info(f"Created new category '{name}' -> ID {wp_category['id']}")
-
-                    except Exception as e:
-                        logger.warning(f"Failed to create category '{name}': {str(e)}")
-                        # Use default category (usually ID 1)
-                        category_ids.append(1)
-                else:
-                    logger.warning(f"Category '{name}' not found and auto-create disabled")
-                    # Use default category
-                    category_ids.append(1)
-
-            return category_ids
-
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Category resolution failed: {str(e)}")
-            # Return default category as fallback
-            return [1] if category_names else []
-        finally:
-            db.close()
+        resolved = await self.resolve_mixed(category_names, [])
+        return resolved["categories"]
 
     async def resolve_tag_ids(self, tag_names: List[str]) -> List[int]:
         """
@@ -168,57 +286,122 @@ class TaxonomyService:
         Returns:
             List of WordPress tag IDs
         """
-        if not tag_names:
-            return []
+        resolved = await self.resolve_mixed([], tag_names)
+        return resolved["tags"]
 
-        db = SessionLocal()
-        try:
-            tag_ids = []
+    async def resolve_mixed(
+        self, category_names: List[str], tag_names: List[str]
+    ) -> Dict[str, List[int]]:
+        """
+        Resolve category and tag names to WordPress IDs in one pass
 
-            for name in tag_names:
-                # Look up in local cache first
-                taxonomy = db.query(Taxonomy).filter(
-                    Taxonomy.type == TaxonomyType.TAG,
-                    Taxonomy.name == name
-                ).first()
-
-                if taxonomy and taxonomy.wp_id:
-                    tag_ids.append(taxonomy.wp_id)
-                    logger.debug(f"Found cached tag '{name}' -> ID {taxonomy.wp_id}")
-                elif self.auto_create_missing:
-                    # Create missing tag
-                    try:
-                        wp_tag = await self._create_missing_tag(name)
-                        tag_ids.append(wp_tag["id"])
-
-                        # Cache the new tag
-                        new_taxonomy = Taxonomy.create_from_wp(TaxonomyType.TAG, wp_tag)
-                        db.add(new_taxonomy)
-                        db.commit()
-
-                        logger.info(f"Created new tag '{name}' -> ID {wp_tag['id']}")
-
-                    except Exception as e:
-                        logger.warning(f"Failed to create tag '{name}': {str(e)}")
-                        # Skip this tag
+        A single tuple-IN query over (type, name) covers both taxonomy
+        types, and all missing entries — categories and tags alike — are
+        created in one concurrent WordPress batch and persisted with one
+        commit.
+
+        Args:
+            category_names: List of category names
+            tag_names: List of tag names
+
+        Returns:
+            Dictionary with resolved category and tag IDs
+        """
+        if not category_names and not tag_names:
+            return {"categories": [], "tags": []}
+
+        try:
+            # Process-local cache first; only unknown pairs hit the DB
+            found: Dict[Tuple[TaxonomyType, str], int] = {}
+            uncached: List[Tuple[TaxonomyType, str]] = []
+            for type_, names in (
+                (TaxonomyType.CATEGORY, category_names),
+                (TaxonomyType.TAG, tag_names),
+            ):
+                for name in dict.fromkeys(names):
+                    wp_id = _tax_cache_get(type_, name)
+                    if wp_id:
+                        found[(type_, name)] = wp_id
+                    else:
+                        uncached.append((type_, name))
+
+            # Phase 1: the coalescer batches our pairs with any other
+            # caller resolving in the same window into one IN-query
+            if uncached:
+                resolved = await _lookup_coalescer.lookup(uncached)
+                for (type_, name), wp_id in resolved.items():
+                    if wp_id:
+                        found[(type_, name)] = wp_id
+                        _tax_cache_put(type_, name, wp_id)
+
+            # Phase 2: create all missing taxonomies concurrently
+            # (independent WordPress calls) with no session held
+            missing = [pair for pair in uncached if not found.get(pair)]
+            new_rows = []
+            if missing and self.auto_create_missing:
+                results = await asyncio.gather(
+                    *(
+                        self._create_missing_category(name)
+                        if type_ is TaxonomyType.CATEGORY
+                        else self._create_missing_tag(name)
+                        for type_, name in missing
+                    ),
+                    return_exceptions=True,
+                )
+                for (type_, name), result in zip(missing, results):
+                    if isinstance(result, Exception):
+                        logger.warning(
+                            f"Failed to create {type_.value} '{name}': {str(result)}"
+                        )
                         continue
+                    found[(type_, name)] = result["id"]
+                    _tax_cache_put(type_, name, result["id"])
+                    new_rows.append(Taxonomy.create_from_wp(type_, result))
+                    logger.info(
+                        f"Created new {type_.value} '{name}' -> ID {result['id']}"
+                    )
+
+            # Phase 3: persist the new rows with one commit
+            if new_rows:
+                with _session_scope() as db:
+                    db.add_all(new_rows)
+                    db.commit()
+
+            category_ids = []
+            for name in category_names:
+                wp_id = found.get((TaxonomyType.CATEGORY, name))
+                if wp_id:
+                    category_ids.append(wp_id)
                 else:
+                    if not self.auto_create_missing:
+                        logger.warning(f"Category '{name}' not found and auto-create disabled")
+                    # Use default category (usually ID 1)
+                    category_ids.append(1)
+
+            tag_ids = []
+            for name in tag_names:
+                wp_id = found.get((TaxonomyType.TAG, name))
+                if wp_id:
+                    tag_ids.append(wp_id)
+                elif not self.auto_create_missing:
                     logger.warning(f"Tag '{name}' not found and auto-create disabled")
+                # Failed tag creations are skipped, as before
 
-            return tag_ids
+            return {"categories": category_ids, "tags": tag_ids}
 
         except Exception as e:
-            db.rollback()
-            logger.error(f"Tag resolution failed: {str(e)}")
-            return []
-        finally:
-            db.close()
+            logger.error(f"Taxonomy resolution failed: {str(e)}")
+            # Default category as fallback; unresolvable tags are dropped
+            return {
+                "categories": [1] if category_names else [],
+                "tags": [],
+            }
 
     async def _create_missing_category(self, name: str) -> Dict[str, Any]:
         """Create a missing category in WordPress"""
         slug = self._generate_slug(name)
 
-        return await wordpress_client.create_category(
+        return await get_wordpress_client().create_category(
             name=name,
             slug=slug,
             description=f"Auto-generated category: {name}"
@@ -228,7 +411,7 @@ class TaxonomyService:
         """Create a missing tag in WordPress"""
         slug = self._generate_slug(name)
 
-        return await wordpress_client.create_tag(
+        return await get_wordpress_client().create_tag(
             name=name,
             slug=slug,
             description=f"Auto-generated tag: {name}"
@@ -244,75 +427,33 @@ class TaxonomyService:
         Returns:
             URL-friendly slug
         """
-        import re
-        import unicodedata
-
-        # Normalize unicode characters
-        slug = unicodedata.normalize('NFKD', name)
-
-        # Convert to lowercase
-        slug = slug.lower()
-
-        # Replace Japanese characters with romanization (simplified)
-        japanese_replacements = {
-            'あ': 'a', 'い': 'i', 'う': 'u', 'え': 'e', 'お': 'o',
-            'か': 'ka', 'き': 'ki', 'く': 'ku', 'け': 'ke', 'こ': 'ko',
-            'が': 'ga', 'ぎ': 'gi', 'ぐ': 'gu', 'げ': 'ge', 'ご': 'go',
-            'さ': 'sa', 'し': 'shi', 'す': 'su', 'せ': 'se', 'そ': 'so',
-            'ざ': 'za', 'じ': 'ji', 'ず': 'zu', 'ぜ': 'ze', 'ぞ': 'zo',
-            'た': 'ta', 'ち': 'chi', 'つ': 'tsu', 'て': 'te', 'と': 'to',
-            'だ': 'da', 'ぢ': 'ji', 'づ': 'zu', 'で': 'de', 'ど': 'do',
-            'な': 'na', 'に': 'ni', 'ぬ': 'nu', 'ね': 'ne', 'の': 'no',
-            'は': 'ha', 'ひ': 'hi', 'ふ': 'fu', 'へ': 'he', 'ほ': 'ho',
-            'ば': 'ba', 'び': 'bi', 'ぶ': 'bu', 'べ': 'be', 'ぼ': 'bo',
-            'ぱ': 'pa', 'ぴ': 'pi', 'ぷ': 'pu', 'ぺ': 'pe', 'ぽ': 'po',
-            'ま': 'ma', 'み': 'mi', 'む': 'mu', 'め': 'me', 'も': 'mo',
-            'や': 'ya', 'ゆ': 'yu', 'よ': 'yo',
-            'ら': 'ra', 'り': 'ri', 'る': 'ru', 'れ': 're', 'ろ': 'ro',
-            'わ': 'wa', 'を': 'wo', 'ん': 'n'
-        }
-
-        for jp, en in japanese_replacements.items():
-            slug = slug.replace(jp, en)
-
-        # Replace common Japanese words
-        common_replacements = {
-            'テクノロジー': 'technology',
-            'ビジネス': 'business',
-            'ライフスタイル': 'lifestyle',
-            'デザイン': 'design',
-            'プログラミング': 'programming',
-            'マーケティング': 'marketing',
-            'デベロップメント': 'development'
-        }
-
-        for jp, en in common_replacements.items():
-            slug = slug.replace(jp, en)
-
-        # Remove non-alphanumeric characters except hyphens
-        slug = re.sub(r'[^a-z0-9\-]', '-', slug)
-
-        # Remove multiple consecutive hyphens
-        slug = re.sub(r'-+', '-', slug)
-
-        # Remove leading/trailing hyphens
-        slug = slug.strip('-')
+        # Normalize unicode characters and lowercase
+        slug = unicodedata.normalize('NFKD', name).lower()
+
+        # Romanize hiragana in one C-level translate pass
+        slug = slug.translate(_HIRAGANA_TRANS)
+
+        # Replace common Japanese words via the compiled alternation
+        slug = _COMMON_WORDS_RE.sub(lambda m: _COMMON_WORDS[m.group(0)], slug)
+
+        # Collapse each run of non-alphanumeric characters to a single
+        # hyphen and trim the edges in one pass
+        slug = _SLUG_RE.sub('-', slug).strip('-')
 
         # Limit length
         if len(slug) > 50:
             slug = slug[:50].rstrip('-')
 
-        # Fallback if slug becomes empty
+        # Fallback if slug becomes empty; blake2b is faster than md5 and
+        # available under FIPS builds
         if not slug:
-            import hashlib
-            slug = hashlib.md5(name.encode()).hexdigest()[:8]
+            slug = hashlib.blake2b(name.encode(), digest_size=4).hexdigest()
 
         return slug
 
     async def get_cached_categories(self) -> List[Dict[str, Any]]:
         """Get cached categories from local database"""
-        db = SessionLocal()
-        try:
+        with _session_scope() as db:
             categories = db.query(Taxonomy).filter(
                 Taxonomy.type == TaxonomyType.CATEGORY
             ).order_by(Taxonomy.name).all()
@@ -327,13 +468,10 @@ class TaxonomyService:
                 }
                 for cat in categories
             ]
-        finally:
-            db.close()
 
     async def get_cached_tags(self) -> List[Dict[str, Any]]:
         """Get cached tags from local database"""
-        db = SessionLocal()
-        try:
+        with _session_scope() as db:
             tags = db.query(Taxonomy).filter(
                 Taxonomy.type == TaxonomyType.TAG
             ).order_by(Taxonomy.name).all()
@@ -348,8 +486,6 @@ class TaxonomyService:
                 }
                 for tag in tags
             ]
-        finally:
-            db.close()
 
     async def resolve_taxonomies_for_article(self, output_data: Dict[str, Any]) -> Dict[str, List[int]]:
         """
@@ -361,20 +497,13 @@ class TaxonomyService:
         Returns:
             Dictionary with resolved category and tag IDs
         """
-        categories = output_data.get("categories", [])
-        tags = output_data.get("tags", [])
-
-        # Resolve concurrently
-        category_ids, tag_ids = await asyncio.gather(
-            self.resolve_category_ids(categories),
-            self.resolve_tag_ids(tags)
+        # One combined pass: a single DB query and one creation batch
+        # instead of parallel per-type pipelines
+        return await self.resolve_mixed(
+            output_data.get("categories", []),
+            output_data.get("tags", []),
         )
 
-        return {
-            "categories": category_ids,
-            "tags": tag_ids
-        }
-
     def set_auto_create_missing(self, enabled: bool) -> None:
         """Configure auto-creation of missing taxonomies"""
         self.auto_create_missing = enabled
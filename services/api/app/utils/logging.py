@@ -1,14 +1,41 @@
 """
 Structured logging configuration
 """
+import atexit
+import hashlib
 import os
 import logging
 import logging.config
-from typing import Dict, Any
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, Optional
 
 import structlog
 from pythonjsonlogger import jsonlogger
 
+# Built once; StackInfoRenderer is stateless and reusable
+_STACK_RENDERER = structlog.processors.StackInfoRenderer()
+_ERROR_METHODS = frozenset(("warning", "error", "critical", "exception"))
+
+
+def _error_details_only(logger, method_name, event_dict):
+    """Render stack/exception info only for WARNING-and-above events
+
+    The hot log_* helpers fire several INFO events per article; keeping
+    the stack/exc processors out of that path means they pay nothing for
+    machinery only error logs use.
+    """
+    if method_name in _ERROR_METHODS:
+        event_dict = _STACK_RENDERER(logger, method_name, event_dict)
+        event_dict = structlog.processors.format_exc_info(
+            logger, method_name, event_dict
+        )
+    return event_dict
+
+
+# Background listener that owns the real (blocking) handlers
+_log_listener: Optional[QueueListener] = None
+
 
 def setup_logging() -> None:
     """Setup structured logging with JSON format"""
@@ -68,6 +95,30 @@ def setup_logging() -> None:
 
     logging.config.dictConfig(logging_config)
 
+    # Emit through a queue: the hot log_* helpers then pay a lock+append
+    # instead of a file write()+flush per event, and a background
+    # listener drains to the real console/file handlers.
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+    log_queue: "queue.Queue" = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    blocking_handlers = []
+    for logger_name in ("", "celery"):
+        target = logging.getLogger(logger_name)
+        blocking_handlers.extend(
+            h for h in target.handlers if h not in blocking_handlers
+        )
+        target.handlers = [queue_handler]
+
+    _log_listener = QueueListener(
+        log_queue, *blocking_handlers, respect_handler_level=True
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
     # Configure structlog
     structlog.configure(
         processors=[
@@ -76,8 +127,7 @@ def setup_logging() -> None:
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
+            _error_details_only,
             structlog.processors.UnicodeDecoder(),
             structlog.processors.JSONRenderer(ensure_ascii=False),
         ],
@@ -93,6 +143,14 @@ def get_logger(name: str) -> structlog.BoundLogger:
     return structlog.get_logger(name)
 
 
+# Pre-bound loggers for the hot helpers below; with
+# cache_logger_on_first_use the configured pipeline binds once instead
+# of being looked up per event
+_article_logger = structlog.get_logger("article_generation")
+_perplexity_logger = structlog.get_logger("perplexity_api")
+_wordpress_logger = structlog.get_logger("wordpress_api")
+
+
 def log_article_generation(
     article_id: str,
     action: str,
@@ -100,8 +158,7 @@ def log_article_generation(
     **kwargs: Any
 ) -> None:
     """Log article generation events with structured data"""
-    logger = get_logger("article_generation")
-    logger.info(
+    _article_logger.info(
         "Article generation event",
         article_id=article_id,
         action=action,
@@ -119,8 +176,7 @@ def log_perplexity_call(
     error: str = None
 ) -> None:
     """Log Perplexity API calls with metrics"""
-    logger = get_logger("perplexity_api")
-    logger.info(
+    _perplexity_logger.info(
         "Perplexity API call",
         article_id=article_id,
         call_type=call_type,
@@ -140,8 +196,7 @@ def log_wordpress_call(
     **kwargs: Any
 ) -> None:
     """Log WordPress API calls"""
-    logger = get_logger("wordpress_api")
-    logger.info(
+    _wordpress_logger.info(
         "WordPress API call",
         article_id=article_id,
         action=action,
@@ -152,23 +207,31 @@ def log_wordpress_call(
     )
 
 
+# Key sets for sanitize_for_logging; frozensets give O(1) membership
+# checks instead of scanning a fresh list per key
+_CONTENT_KEYS = frozenset(("body_html", "content", "summary"))
+_SECRET_KEYS = frozenset(("password", "token", "key", "secret"))
+_REDACTED = "***REDACTED***"
+
+
 def sanitize_for_logging(data: Dict[str, Any]) -> Dict[str, Any]:
     """Sanitize data for logging (remove PII, truncate large content)"""
     sanitized = {}
 
     for key, value in data.items():
-        if key in ["body_html", "content", "summary"]:
+        if key in _CONTENT_KEYS:
             # Truncate long content and hash for privacy
             if isinstance(value, str) and len(value) > 100:
-                import hashlib
-                content_hash = hashlib.md5(value.encode()).hexdigest()[:8]
+                content_hash = hashlib.blake2b(
+                    value.encode(), digest_size=4
+                ).hexdigest()
                 sanitized[f"{key}_hash"] = content_hash
                 sanitized[f"{key}_length"] = len(value)
             else:
                 sanitized[key] = value
-        elif key in ["password", "token", "key", "secret"]:
+        elif key in _SECRET_KEYS:
             # Hide sensitive data
-            sanitized[key] = "***REDACTED***"
+            sanitized[key] = _REDACTED
         else:
             sanitized[key] = value
 
@@ -1,11 +1,112 @@
 """
 Celery application configuration
 """
+import asyncio
+import logging
 import os
+import random
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+import orjson
 from celery import Celery
-from celery.signals import setup_logging
+from celery.signals import (
+    setup_logging, worker_process_init, worker_process_shutdown
+)
+from kombu.serialization import register
+from sqlalchemy.orm import scoped_session
+
+try:
+    # Pulled in by uvicorn[standard]; the API process already runs on it
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
+from app.deps import get_settings, SessionLocal
+
+T = TypeVar("T")
+
+# Thread-local session registry shared by the task base classes. Tasks
+# call db_session() to get this thread's session and db_session.remove()
+# when done; the underlying pooled connection stays open across tasks.
+db_session = scoped_session(SessionLocal)
+
+# One event loop per worker process, running on a daemon thread. Tasks
+# schedule coroutines onto it instead of building and tearing down a
+# fresh loop per invocation, so httpx connection pools, TLS sessions and
+# DNS caches in the API clients stay warm across tasks.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_loop_lock = threading.Lock()
+
+
+def _ensure_worker_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the process-wide worker event loop"""
+    global _worker_loop
+    with _worker_loop_lock:
+        if _worker_loop is None or _worker_loop.is_closed():
+            # uvloop halves per-await overhead for the I/O-bound tasks
+            # this loop runs; fall back to the stdlib loop without it
+            loop = (
+                uvloop.new_event_loop() if uvloop is not None
+                else asyncio.new_event_loop()
+            )
+            threading.Thread(
+                target=loop.run_forever,
+                name="celery-asyncio-loop",
+                daemon=True,
+            ).start()
+            _worker_loop = loop
+        return _worker_loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the persistent worker loop and wait for it"""
+    return asyncio.run_coroutine_threadsafe(coro, _ensure_worker_loop()).result()
+
+
+@worker_process_init.connect
+def _init_worker_loop(*args, **kwargs):
+    """Warm the loop at fork time rather than on the first task"""
+    _ensure_worker_loop()
 
-from app.deps import get_settings
+
+@worker_process_shutdown.connect
+def _close_worker_loop(*args, **kwargs):
+    """Drain long-lived client pools and stop the loop on clean exit
+
+    The API clients deliberately keep their pooled connections open for
+    the worker's lifetime, so closing has to happen here rather than per
+    task.
+    """
+    loop = _worker_loop
+    if loop is None or loop.is_closed():
+        return
+
+    from app.clients.pplx_client import perplexity_client
+    from app.clients.wp_client import get_wordpress_client
+
+    async def _drain() -> None:
+        await perplexity_client.close()
+        # Only close the WP client if something actually built it
+        if get_wordpress_client.cache_info().currsize:
+            await get_wordpress_client().close()
+
+    try:
+        asyncio.run_coroutine_threadsafe(_drain(), loop).result(timeout=10)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+
+# Task payloads carry full article HTML; orjson encodes/decodes them in
+# C and emits bytes directly, skipping the stdlib json encoder loop on
+# every publish/generate round trip through the broker.
+register(
+    "orjson",
+    orjson.dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="binary",
+)
 
 
 def create_celery_app() -> Celery:
@@ -24,20 +125,25 @@ def create_celery_app() -> Celery:
 
     # Configuration
     celery_app.conf.update(
-        # Task settings
-        task_serializer="json",
-        accept_content=["json"],
-        result_serializer="json",
+        # Task settings ("json" stays accepted so in-flight tasks from
+        # older workers still decode during a rolling deploy)
+        task_serializer="orjson",
+        accept_content=["orjson", "json"],
+        result_serializer="orjson",
         timezone="Asia/Tokyo",
         enable_utc=True,
 
-        # Task routing
+        # Task routing (exact dead-letter match must precede the glob)
         task_routes={
             "generate.*": {"queue": "generation"},
+            "publish.dlq": {"queue": "dlq"},
             "publish.*": {"queue": "publishing"},
         },
 
-        # Worker settings
+        # Worker settings. Prefetch 1 + late acks suit the long-running
+        # generation tasks; the dedicated publishing worker overrides
+        # prefetch to 4 on its command line (see docker-compose.yml)
+        # since its tasks are short HTTP round trips.
         worker_prefetch_multiplier=1,
         task_acks_late=True,
         worker_disable_rate_limits=False,
@@ -65,6 +171,25 @@ def create_celery_app() -> Celery:
 # Create celery instance
 celery = create_celery_app()
 
+logger = logging.getLogger(__name__)
+
+
+def jittered_countdown(retries: int, base: int = 60) -> float:
+    """Full-jitter backoff so an outage cohort doesn't retry in lockstep"""
+    return random.uniform(0, base * (2 ** retries))
+
+
+def send_to_dlq(article_id: str, task_name: str, error: str) -> None:
+    """Park a terminally failed task on the dead-letter queue
+
+    The dlq queue has no regular consumer; messages sit there for an
+    operator to inspect or replay (celery worker -Q dlq).
+    """
+    try:
+        celery.send_task("publish.dlq", args=[article_id, task_name, error])
+    except Exception:
+        logger.exception(f"Failed to dead-letter {task_name} for {article_id}")
+
 
 @setup_logging.connect
 def config_loggers(*args, **kwargs):
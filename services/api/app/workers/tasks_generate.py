@@ -1,118 +1,123 @@
 """
 Article generation tasks
 """
+import functools
 import hashlib
-import json
 import logging
-import asyncio
 from typing import Dict, Any, Optional
 
+import orjson
+
 from celery import Task
 from sqlalchemy.orm import Session
 
-from app.workers.celery_app import celery
-from app.deps import SessionLocal
+from app.workers.celery_app import (
+    celery, db_session, jittered_countdown, run_async, send_to_dlq
+)
 from app.models import Article, ArticleStatus, Job, JobStatus
 from app.schemas import GenerateInput, ArticleOutput
 from app.services.generation import generation_service
-from app.services.sanitizer import count_ja_chars_from_html
+from app.services.sanitizer import count_ja_chars_from_html, sanitize_output_payload
 
 logger = logging.getLogger(__name__)
 
 
 class DatabaseTask(Task):
-    """Base task with database session management"""
+    """Base task that injects a thread-scoped database session
+
+    The task body receives the session as its first argument after
+    self; callers enqueue without it.
+    """
 
     def __call__(self, *args, **kwargs):
-        """Execute task with database session"""
-        db = SessionLocal()
+        """Run the task body with the thread-scoped database session"""
+        db = db_session()
         try:
-            return self.run_with_db(db, *args, **kwargs)
+            return self.run(db, *args, **kwargs)
         finally:
-            db.close()
-
-    def run_with_db(self, db: Session, *args, **kwargs):
-        """Override this method in subclasses"""
-        raise NotImplementedError
+            # Releases the session back to the registry; the pooled
+            # connection itself survives for the next task
+            db_session.remove()
 
 
 @celery.task(bind=True, base=DatabaseTask, name="generate.article")
-def task_generate_article(self, article_id: str) -> Dict[str, Any]:
+def task_generate_article(self, db: Session, article_id: str) -> Dict[str, Any]:
     """
     Generate article content using Perplexity API
 
     Args:
+        db: Database session (injected by DatabaseTask)
         article_id: UUID of the article to generate
 
     Returns:
         Generation result
     """
-    def run_with_db(self, db: Session, article_id: str) -> Dict[str, Any]:
-        try:
-            # Get article
-            article = db.query(Article).filter(Article.id == article_id).first()
-            if not article:
-                raise ValueError(f"Article {article_id} not found")
-
-            # Update status
-            article.status = ArticleStatus.GENERATING
-            db.commit()
-
-            logger.info(f"Starting article generation for {article_id}")
-
-            # Parse input
-            input_data = GenerateInput(**article.input_payload)
-
-            # Use the generation service
-            logger.info(f"Using generation service for {article_id}")
-
-            # Run async generation in sync context
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                final_content = loop.run_until_complete(
-                    generation_service.generate_complete_article(input_data)
-                )
-            finally:
-                loop.close()
-
-            # Validate and store
-            output = ArticleOutput(**final_content)
-            char_count = count_ja_chars_from_html(output.body_html)
-
-            article.store_output(
-                output_data=output.dict(),
-                status=ArticleStatus.GENERATED,
-                char_count=char_count
-            )
+    article = None
+    try:
+        # Get article
+        article = db.query(Article).filter(Article.id == article_id).first()
+        if not article:
+            raise ValueError(f"Article {article_id} not found")
+
+        # Update status
+        article.status = ArticleStatus.GENERATING
+        db.commit()
+
+        logger.info(f"Starting article generation for {article_id}")
+
+        # Parse input
+        input_data = GenerateInput(**article.input_payload)
+
+        # Use the generation service
+        logger.info(f"Using generation service for {article_id}")
+
+        # Run async generation on the persistent worker loop; no
+        # per-task loop setup/teardown, HTTP pools stay warm
+        final_content = run_async(
+            generation_service.generate_complete_article(input_data)
+        )
+
+        # Validate the payload, then store the original dict; the
+        # generation service already emits JSON-native values, so a
+        # model_dump round trip would just rebuild the same ~10KB
+        # structure
+        ArticleOutput.model_validate(final_content)
+        char_count = count_ja_chars_from_html(final_content["body_html"])
+
+        output_data = final_content
+        article.store_output(
+            output_data=output_data,
+            status=ArticleStatus.GENERATED,
+            char_count=char_count
+        )
+        # Sanitize once here so GET/preview reads are pure dict reads
+        article.sanitized_payload = sanitize_output_payload(output_data)
+        db.commit()
+
+        logger.info(f"Article generation completed for {article_id}, char_count: {char_count}")
+
+        return {
+            "article_id": article_id,
+            "status": "generated",
+            "char_count": char_count
+        }
+
+    except Exception as e:
+        logger.error(f"Article generation failed for {article_id}: {str(e)}")
+
+        # Update article status
+        if article is not None:
+            article.status = ArticleStatus.FAILED
             db.commit()
 
-            logger.info(f"Article generation completed for {article_id}, char_count: {char_count}")
+        # Retry transient failures (jittered); a missing article and
+        # exhausted retries go to the dead-letter queue
+        if not isinstance(e, ValueError) and self.request.retries < self.max_retries:
+            logger.info(f"Retrying article generation for {article_id} (attempt {self.request.retries + 1})")
+            raise self.retry(countdown=jittered_countdown(self.request.retries))
 
-            return {
-                "article_id": article_id,
-                "status": "generated",
-                "char_count": char_count
-            }
-
-        except Exception as e:
-            logger.error(f"Article generation failed for {article_id}: {str(e)}")
-
-            # Update article status
-            if 'article' in locals():
-                article.status = ArticleStatus.FAILED
-                db.commit()
-
-            # Retry if not final attempt
-            if self.request.retries < self.max_retries:
-                logger.info(f"Retrying article generation for {article_id} (attempt {self.request.retries + 1})")
-                raise self.retry(countdown=60 * (2 ** self.request.retries))
-
-            raise
-
-    # Assign the method to the task
-    self.run_with_db = run_with_db.__get__(self, type(self))
-    return self.run_with_db(article_id)
+        send_to_dlq(article_id, self.name, str(e))
+        raise
 
 
 
@@ -125,11 +130,19 @@ def cleanup_old_results():
     return {"cleaned": 0}
 
 
-def generate_idempotency_key(input_data: Dict[str, Any]) -> str:
-    """Generate idempotency key from input data"""
+@functools.lru_cache(maxsize=1024)
+def _idem_key_for_frozen(frozen_json: bytes) -> bytes:
+    """Hash a canonical JSON serialization (cached for repeat requests)"""
+    return hashlib.sha256(frozen_json).digest()
+
+
+def generate_idempotency_key(input_data: Dict[str, Any]) -> bytes:
+    """Generate idempotency key (raw sha256 digest) from input data"""
     # Remove non-deterministic fields
     clean_data = {k: v for k, v in input_data.items() if k not in ['author']}
 
-    # Create hash
-    json_str = json.dumps(clean_data, sort_keys=True, ensure_ascii=False)
-    return hashlib.sha256(json_str.encode()).hexdigest()[:32]
\ No newline at end of file
+    # Canonical serialization; retrying clients resend identical payloads,
+    # so the LRU turns their re-hash into a dict hit
+    # default=str covers pydantic str subclasses such as HttpUrl
+    frozen = orjson.dumps(clean_data, option=orjson.OPT_SORT_KEYS, default=str)
+    return _idem_key_for_frozen(frozen)
\ No newline at end of file
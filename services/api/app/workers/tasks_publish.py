@@ -1,125 +1,202 @@
 """
 WordPress publishing tasks
 """
-import logging
 import asyncio
-from typing import Dict, Any
+import logging
+import os
+from typing import AsyncIterator, Dict, Any, Optional
 from datetime import datetime
 
+import msgspec
 from celery import Task
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.orm import Session
 
-from app.workers.celery_app import celery
-from app.deps import SessionLocal
+from app.clients.wp_client import WordPressAuthError
+from app.workers.celery_app import (
+    celery, db_session, jittered_countdown, run_async, send_to_dlq
+)
 from app.models import Article, ArticleStatus
-from app.schemas import PublishRequest
+from app.schemas import PublishMode
 
 logger = logging.getLogger(__name__)
 
 
+class _PublishParams(msgspec.Struct):
+    """Worker-side view of the API's PublishRequest
+
+    msgspec.convert rebuilds the typed fields (enum, datetime) from the
+    broker dict in C, without re-running API-edge validation — in
+    particular the schedule_at-must-be-in-the-future check, which could
+    spuriously reject a scheduled post whose moment arrived while the
+    task sat in the queue.
+    """
+
+    mode: PublishMode
+    schedule_at: Optional[datetime] = None
+
+# Failures no number of retries can fix: bad credentials, or an article
+# that is missing / in the wrong state
+_NON_RETRYABLE = (WordPressAuthError, ValueError)
+
+# The publish path's statements, built once at import; per task only the
+# bind parameters change, so statement construction and the compiled-SQL
+# cache key computation stay off the hot path.
+_CLAIM_STMT = (
+    update(Article)
+    .where(
+        Article.id == bindparam("article_id"),
+        Article.status == ArticleStatus.GENERATED,
+    )
+    .values(status=ArticleStatus.PUBLISHING)
+    .returning(Article.output_payload)
+)
+_STATUS_STMT = select(Article.status).where(Article.id == bindparam("article_id"))
+_FINISH_STMT = (
+    update(Article)
+    .where(Article.id == bindparam("article_id"))
+    .values(
+        status=ArticleStatus.PUBLISHED,
+        wp_post_id=bindparam("wp_post_id"),
+        wp_url=bindparam("wp_url"),
+    )
+)
+_FAIL_STMT = (
+    update(Article)
+    .where(Article.id == bindparam("article_id"))
+    .values(status=ArticleStatus.FAILED)
+)
+# Hands a claimed row back before a retry: the retried attempt's claim
+# only matches GENERATED, so leaving the row PUBLISHING (or FAILED)
+# would guarantee the retry dead-letters with a not-ready error.
+_RELEASE_STMT = (
+    update(Article)
+    .where(
+        Article.id == bindparam("article_id"),
+        Article.status == ArticleStatus.PUBLISHING,
+    )
+    .values(status=ArticleStatus.GENERATED)
+)
+
+
 class DatabaseTask(Task):
-    """Base task with database session management"""
+    """Base task that injects a thread-scoped database session
+
+    The task body receives the session as its first argument after
+    self; callers enqueue without it.
+    """
 
     def __call__(self, *args, **kwargs):
-        """Execute task with database session"""
-        db = SessionLocal()
+        """Run the task body with the thread-scoped database session"""
+        db = db_session()
         try:
-            return self.run_with_db(db, *args, **kwargs)
+            return self.run(db, *args, **kwargs)
         finally:
-            db.close()
-
-    def run_with_db(self, db: Session, *args, **kwargs):
-        """Override this method in subclasses"""
-        raise NotImplementedError
+            # Releases the session back to the registry; the pooled
+            # connection itself survives for the next task
+            db_session.remove()
 
 
 @celery.task(bind=True, base=DatabaseTask, name="publish.article")
-def task_publish_article(self, article_id: str, publish_data: Dict[str, Any]) -> Dict[str, Any]:
+def task_publish_article(self, db: Session, article_id: str, publish_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Publish article to WordPress
 
     Args:
+        db: Database session (injected by DatabaseTask)
         article_id: UUID of the article to publish
         publish_data: Publishing configuration
 
     Returns:
         Publishing result
     """
-    def run_with_db(self, db: Session, article_id: str, publish_data: Dict[str, Any]) -> Dict[str, Any]:
-        try:
-            # Get article
-            article = db.query(Article).filter(Article.id == article_id).first()
-            if not article:
+    article_found = False
+    try:
+        # Claim the row with one conditional UPDATE .. RETURNING
+        # instead of hydrating the full ORM article: the status
+        # check, the PUBLISHING transition and the payload read are
+        # a single round trip.
+        claimed = db.execute(
+            _CLAIM_STMT, {"article_id": article_id}
+        ).first()
+        db.commit()
+
+        if claimed is None:
+            current = db.execute(
+                _STATUS_STMT, {"article_id": article_id}
+            ).scalar_one_or_none()
+            if current is None:
                 raise ValueError(f"Article {article_id} not found")
-
-            if article.status != ArticleStatus.GENERATED:
-                raise ValueError(f"Article {article_id} is not ready for publishing (status: {article.status})")
-
-            # Update status
-            article.status = ArticleStatus.PUBLISHING
-            db.commit()
-
-            logger.info(f"Starting WordPress publishing for {article_id}")
-
-            # Parse publish request
-            publish_request = PublishRequest(**publish_data)
-
-            # Step 1: Resolve taxonomies
-            logger.info(f"Resolving taxonomies for {article_id}")
-
-            # Run async taxonomy resolution in sync context
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                taxonomy_ids = loop.run_until_complete(
-                    _resolve_taxonomies(article.output_payload)
-                )
-
-                # Step 2: Prepare WordPress payload
-                wp_payload = _prepare_wp_payload(article, publish_request, taxonomy_ids)
-
-                # Step 3: Publish to WordPress
-                logger.info(f"Publishing to WordPress for {article_id}")
-                wp_result = loop.run_until_complete(
-                    _publish_to_wordpress(article_id, wp_payload)
-                )
-            finally:
-                loop.close()
-
-            # Step 4: Update article with WordPress info
-            article.mark_published(
-                wp_post_id=wp_result["id"],
-                wp_url=wp_result["link"]
-            )
-            db.commit()
-
-            logger.info(f"WordPress publishing completed for {article_id}, post_id: {wp_result['id']}")
-
-            return {
+            article_found = True
+            raise ValueError(f"Article {article_id} is not ready for publishing (status: {current})")
+
+        article_found = True
+        output_payload = claimed[0]
+
+        logger.info(f"Starting WordPress publishing for {article_id}")
+
+        # The API validated publish_data at ingress; decode it into the
+        # lightweight msgspec struct instead of a pydantic model
+        publish_request = msgspec.convert(publish_data, _PublishParams)
+
+        # The async steps run as one coroutine on the persistent
+        # worker loop: resolve taxonomies, build the payload, POST
+        # to WordPress. The payload dict crosses to the loop thread,
+        # never the session.
+        wp_result = run_async(
+            _publish_pipeline(article_id, output_payload, publish_request)
+        )
+
+        # One final UPDATE + commit records the WordPress result
+        db.execute(
+            _FINISH_STMT,
+            {
                 "article_id": article_id,
                 "wp_post_id": wp_result["id"],
                 "wp_url": wp_result["link"],
-                "status": wp_result["status"]
-            }
+            },
+        )
+        db.commit()
 
-        except Exception as e:
-            logger.error(f"WordPress publishing failed for {article_id}: {str(e)}")
+        logger.info(f"WordPress publishing completed for {article_id}, post_id: {wp_result['id']}")
 
-            # Update article status
-            if 'article' in locals():
-                article.status = ArticleStatus.FAILED
-                db.commit()
+        return {
+            "article_id": article_id,
+            "wp_post_id": wp_result["id"],
+            "wp_url": wp_result["link"],
+            "status": wp_result["status"]
+        }
 
-            # Retry if not final attempt
-            if self.request.retries < self.max_retries:
-                logger.info(f"Retrying WordPress publishing for {article_id} (attempt {self.request.retries + 1})")
-                raise self.retry(countdown=60 * (2 ** self.request.retries))
+    except Exception as e:
+        logger.error(f"WordPress publishing failed for {article_id}: {str(e)}")
+
+        # Decide the retry before touching status: a retried attempt
+        # must find the row GENERATED again, so a transient failure
+        # releases the claim and only a terminal one marks FAILED.
+        will_retry = self.request.retries < self.max_retries and (
+            isinstance(e, TimeoutError) or not isinstance(e, _NON_RETRYABLE)
+        )
+
+        if article_found:
+            db.rollback()
+            db.execute(
+                _RELEASE_STMT if will_retry else _FAIL_STMT,
+                {"article_id": article_id},
+            )
+            db.commit()
 
-            raise
+        if will_retry:
+            # Deadline exhaustion is a capacity signal, not a WP error;
+            # retry it on a shorter jittered curve
+            if isinstance(e, TimeoutError):
+                logger.info(f"Publish deadline exceeded for {article_id}, retrying (attempt {self.request.retries + 1})")
+                raise self.retry(countdown=jittered_countdown(self.request.retries, base=15))
+            logger.info(f"Retrying WordPress publishing for {article_id} (attempt {self.request.retries + 1})")
+            raise self.retry(countdown=jittered_countdown(self.request.retries))
 
-    # Assign the method to the task
-    self.run_with_db = run_with_db.__get__(self, type(self))
-    return self.run_with_db(article_id, publish_data)
+        # Permanent failures and exhausted retries dead-letter
+        send_to_dlq(article_id, self.name, str(e))
+        raise
 
 
 async def _resolve_taxonomies(output_data: Dict[str, Any]) -> Dict[str, list]:
@@ -128,112 +205,144 @@ async def _resolve_taxonomies(output_data: Dict[str, Any]) -> Dict[str, list]:
     return await taxonomy_service.resolve_taxonomies_for_article(output_data)
 
 
-def _prepare_wp_payload(article: Article, publish_request: PublishRequest, taxonomy_ids: Dict[str, list]) -> Dict[str, Any]:
-    """Prepare WordPress API payload"""
-    output = article.output_payload
-
-    payload = {
-        "title": output["title"],
-        "content": output["body_html"],
-        "excerpt": output["excerpt"],
-        "slug": output["slug"],
-        "status": publish_request.mode.value,
-        "categories": taxonomy_ids["categories"],
-        "tags": taxonomy_ids["tags"],
-        "meta": {
-            "description": output["meta_description"]
-        }
-    }
-
-    # Handle scheduled posts
-    if publish_request.mode.value == "schedule" and publish_request.schedule_at:
-        payload["date"] = publish_request.schedule_at.isoformat()
-
-    return payload
-
-
-async def _publish_to_wordpress(article_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Publish to WordPress via REST API"""
-    from app.clients.wp_client import wordpress_client
-
-    return await wordpress_client.create_post(
-        article_id=article_id,
-        title=payload["title"],
-        content=payload["content"],
-        status=payload["status"],
-        excerpt=payload.get("excerpt", ""),
-        slug=payload.get("slug"),
-        categories=payload.get("categories", []),
-        tags=payload.get("tags", []),
-        meta=payload.get("meta", {}),
-        featured_media=payload.get("featured_media"),
-        date=payload.get("date")
-    )
+async def _publish_pipeline(
+    article_id: str, output: Dict[str, Any], publish_request: _PublishParams
+) -> Dict[str, Any]:
+    """Resolve taxonomies and POST to WordPress in one awaitable
+
+    create_post is called with keyword args straight from the output
+    payload; the old intermediate dict existed only to be unpacked
+    field-by-field on the next line. The whole pipeline runs under one
+    end-to-end deadline, so a hung taxonomy call and a hung POST can't
+    each burn a full socket timeout.
+    """
+    from app.clients.wp_client import get_wordpress_client
+    from app.deps import get_settings
+
+    async with asyncio.timeout(get_settings().wp_publish_deadline):
+        logger.info(f"Resolving taxonomies for {article_id}")
+        taxonomy_ids = await _resolve_taxonomies(output)
+
+        # Scheduled posts carry an explicit publish date
+        date = (
+            publish_request.schedule_at.isoformat()
+            if publish_request.mode.value == "schedule" and publish_request.schedule_at
+            else None
+        )
+
+        logger.info(f"Publishing to WordPress for {article_id}")
+        return await get_wordpress_client().create_post(
+            article_id=article_id,
+            title=output["title"],
+            content=output["body_html"],
+            status=publish_request.mode.value,
+            excerpt=output["excerpt"],
+            slug=output["slug"],
+            categories=taxonomy_ids["categories"],
+            tags=taxonomy_ids["tags"],
+            meta={"description": output["meta_description"]},
+            date=date
+        )
+
+
+# Chunk size for streamed media uploads
+_MEDIA_CHUNK_SIZE = 64 * 1024
+
+
+async def _iter_file_chunks(path: str) -> AsyncIterator[bytes]:
+    """Yield a file in 64 KiB chunks, reading off the loop via to_thread"""
+    f = await asyncio.to_thread(open, path, "rb")
+    try:
+        while True:
+            chunk = await asyncio.to_thread(f.read, _MEDIA_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        f.close()
 
 
 @celery.task(bind=True, base=DatabaseTask, name="publish.upload_media")
-def task_upload_media(self, article_id: str, media_data: Dict[str, Any]) -> Dict[str, Any]:
+def task_upload_media(self, db: Session, article_id: str, media_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Upload media to WordPress
 
     Args:
+        db: Database session (injected by DatabaseTask)
         article_id: UUID of the article
-        media_data: Media upload configuration
+        media_data: Media upload configuration. Prefer "source" (a path
+            on the worker's shared volume) so the file streams to
+            WordPress in 64 KiB chunks; inline "file_data" is still
+            accepted but rides through the broker and sits in memory
+            whole.
 
     Returns:
         Media upload result
     """
-    def run_with_db(self, db: Session, article_id: str, media_data: Dict[str, Any]) -> Dict[str, Any]:
-        try:
-            logger.info(f"Starting media upload for {article_id}")
-
-            # Extract media information
-            file_data = media_data.get("file_data")
-            filename = media_data.get("filename")
-            mime_type = media_data.get("mime_type")
-            title = media_data.get("title")
-            alt_text = media_data.get("alt_text")
-
-            if not all([file_data, filename, mime_type]):
-                raise ValueError("Missing required media data: file_data, filename, mime_type")
-
-            # Upload to WordPress
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                from app.clients.wp_client import wordpress_client
-
-                wp_result = loop.run_until_complete(
-                    wordpress_client.upload_media(
-                        article_id=article_id,
-                        file_data=file_data,
-                        filename=filename,
-                        mime_type=mime_type,
-                        title=title,
-                        alt_text=alt_text
-                    )
-                )
-            finally:
-                loop.close()
-
-            logger.info(f"Media upload completed for {article_id}, media_id: {wp_result['id']}")
-
-            return {
-                "article_id": article_id,
-                "media_id": wp_result["id"],
-                "media_url": wp_result["source_url"]
-            }
+    try:
+        logger.info(f"Starting media upload for {article_id}")
+
+        # Extract media information
+        source = media_data.get("source")
+        file_data = media_data.get("file_data")
+        filename = media_data.get("filename")
+        mime_type = media_data.get("mime_type")
+        title = media_data.get("title")
+        alt_text = media_data.get("alt_text")
+
+        if not all([source or file_data, filename, mime_type]):
+            raise ValueError("Missing required media data: source or file_data, filename, mime_type")
+
+        # Upload to WordPress on the persistent worker loop
+        from app.clients.wp_client import get_wordpress_client
+
+        if source:
+            # Stream from disk: O(chunk) memory and no broker blob
+            content = _iter_file_chunks(source)
+            content_length = os.path.getsize(source)
+        else:
+            content = file_data
+            content_length = None
+
+        wp_result = run_async(
+            get_wordpress_client().upload_media(
+                article_id=article_id,
+                file_data=content,
+                filename=filename,
+                mime_type=mime_type,
+                title=title,
+                alt_text=alt_text,
+                content_length=content_length
+            )
+        )
 
-        except Exception as e:
-            logger.error(f"Media upload failed for {article_id}: {str(e)}")
+        logger.info(f"Media upload completed for {article_id}, media_id: {wp_result['id']}")
+
+        return {
+            "article_id": article_id,
+            "media_id": wp_result["id"],
+            "media_url": wp_result["source_url"]
+        }
 
-            # Retry if not final attempt
-            if self.request.retries < self.max_retries:
-                logger.info(f"Retrying media upload for {article_id} (attempt {self.request.retries + 1})")
-                raise self.retry(countdown=30 * (2 ** self.request.retries))
+    except Exception as e:
+        logger.error(f"Media upload failed for {article_id}: {str(e)}")
 
-            raise
+        # Retry transient failures (jittered); permanent ones and
+        # exhausted retries go to the dead-letter queue
+        if not isinstance(e, _NON_RETRYABLE) and self.request.retries < self.max_retries:
+            logger.info(f"Retrying media upload for {article_id} (attempt {self.request.retries + 1})")
+            raise self.retry(countdown=jittered_countdown(self.request.retries, base=30))
 
-    # Assign the method to the task
-    self.run_with_db = run_with_db.__get__(self, type(self))
-    return self.run_with_db(article_id, media_data)
\ No newline at end of file
+        send_to_dlq(article_id, self.name, str(e))
+        raise
+
+
+@celery.task(name="publish.dlq")
+def task_dead_letter(article_id: str, task_name: str, error: str) -> Dict[str, Any]:
+    """Dead-letter sink for terminally failed tasks
+
+    Routed to the dlq queue, which no regular worker consumes; run
+    `celery worker -Q dlq` to drain it after investigating.
+    """
+    logger.error(f"Dead letter: {task_name} for {article_id}: {error}")
+    return {"article_id": article_id, "task": task_name, "error": error}